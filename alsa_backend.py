@@ -76,13 +76,34 @@ def set_volume(control, value, cardindex=1):
     except Exception:
         pass
 
+# Open mixer handles keyed by (cardindex, control); each open parses the card's control DB
+_mixer_cache = {}
+
+def open_mixer(control, cardindex=1):
+    """Like get_mixer, but lets the ALSA error propagate when the control can't be opened."""
+    key = (cardindex, control)
+    mixer = _mixer_cache.get(key)
+    if mixer is None:
+        mixer = _mixer_cache[key] = alsaaudio.Mixer(control=control, cardindex=cardindex)
+    return mixer
+
 def get_mixer(control, cardindex=1):
-    """Get ALSA mixer object for a control."""
+    """Get ALSA mixer object for a control, reusing a previously opened handle."""
     try:
-        return alsaaudio.Mixer(control=control, cardindex=cardindex)
+        return open_mixer(control, cardindex)
     except Exception:
         return None
 
+class LazyMixer:
+    """Stand-in for alsaaudio.Mixer that only opens the control when it is first used."""
+
+    def __init__(self, control, cardindex=1):
+        self.control = control
+        self.cardindex = cardindex
+
+    def __getattr__(self, name):
+        return getattr(open_mixer(self.control, self.cardindex), name)
+
 def set_crosspoint_volume(chan_L, chan_R, main_L, main_R, pan_val, linked):
     """
     Sets ALSA volume for main and cross controls based on pan position.
@@ -7,11 +7,14 @@ Layout Manager for Patchbay
 """
 
 import json
+import logging
 import os
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class BlockLayout:
@@ -187,7 +190,7 @@ class LayoutManager:
     def apply_layout_to_patchbay(self, layout: PatchbayLayout, patchbay_view, progress_callback=None) -> bool:
         """Apply a layout to the patchbay view."""
         try:
-            print(f"[DEBUG] Starting to apply layout: {layout.name}")
+            log.debug("Starting to apply layout: %s", layout.name)
             
             if progress_callback:
                 progress_callback(5)  # 5% - Starting
@@ -197,7 +200,7 @@ class LayoutManager:
             patchbay_view.graphics_scene.setSceneRect(patchbay_view.graphics_scene.sceneRect())
             
             # Clear existing groups first
-            print("[DEBUG] Clearing existing groups...")
+            log.debug("Clearing existing groups...")
             groups_to_remove = []
             for item in patchbay_view.graphics_scene.items():
                 if hasattr(item, 'block1') and hasattr(item, 'block2'):
@@ -207,20 +210,20 @@ class LayoutManager:
                 try:
                     group.ungroup()
                 except Exception as e:
-                    print(f"[WARNING] Failed to ungroup: {e}")
+                    log.warning("Failed to ungroup: %s", e)
             
             if progress_callback:
                 progress_callback(10)  # 10% - Groups cleared
             
             # Create a lookup dictionary for blocks to avoid O(n²) search
-            print("[DEBUG] Creating block lookup dictionary...")
+            log.debug("Creating block lookup dictionary...")
             block_lookup = {}
             for item in patchbay_view.graphics_scene.items():
                 if hasattr(item, 'ctl_name'):
                     block_lookup[item.ctl_name] = item
             
-            print(f"[DEBUG] Found {len(block_lookup)} blocks in scene")
-            print(f"[DEBUG] Applying {len(layout.blocks)} blocks...")
+            log.debug("Found %d blocks in scene", len(block_lookup))
+            log.debug("Applying %d blocks...", len(layout.blocks))
             
             if progress_callback:
                 progress_callback(15)  # 15% - Lookup created
@@ -239,7 +242,7 @@ class LayoutManager:
             blocks_processed = 0
             for i, block_layout in enumerate(layout.blocks):
                 if i % 100 == 0:  # Progress update every 100 blocks
-                    print(f"[DEBUG] Progress: {i}/{len(layout.blocks)} blocks processed")
+                    log.debug("Progress: %d/%d blocks processed", i, len(layout.blocks))
                     if progress_callback:
                         # Progress from 15% to 60% for blocks
                         progress_value = 15 + int((i / len(layout.blocks)) * 45)
@@ -263,15 +266,15 @@ class LayoutManager:
                 else:
                     # Only warn about missing blocks if there are few of them
                     if len(layout.blocks) < 50 or i < 10:
-                        print(f"[WARNING] Block {block_layout.ctl_name} not found in scene")
+                        log.warning("Block %s not found in scene", block_layout.ctl_name)
             
-            print(f"[DEBUG] Successfully processed {blocks_processed}/{len(layout.blocks)} blocks")
+            log.debug("Successfully processed %d/%d blocks", blocks_processed, len(layout.blocks))
             
             if progress_callback:
                 progress_callback(60)  # 60% - Data collected
             
             # Apply all position changes at once
-            print("[DEBUG] Applying positions...")
+            log.debug("Applying positions...")
             for item, x, y in block_positions:
                 item.setPos(x, y)
             
@@ -279,7 +282,7 @@ class LayoutManager:
                 progress_callback(65)  # 65% - Positions applied
             
             # Apply all fader changes at once
-            print("[DEBUG] Applying fader values...")
+            log.debug("Applying fader values...")
             for item, fader_value in fader_updates:
                 item.fader_value = fader_value
                 item.update_fader(skip_alsa=True)
@@ -288,7 +291,7 @@ class LayoutManager:
                 progress_callback(70)  # 70% - Faders applied
             
             # Apply all mute/solo states at once (batch mode)
-            print("[DEBUG] Applying mute/solo states...")
+            log.debug("Applying mute/solo states...")
             for ctl_name, muted in mute_states:
                 manager.set_mute(ctl_name, muted, skip_alsa=True, explicit=True, batch=True)
             
@@ -302,7 +305,7 @@ class LayoutManager:
                 progress_callback(75)  # 75% - States applied
             
             if layout.groups:
-                print(f"[DEBUG] Creating {len(layout.groups)} groups...")
+                log.debug("Creating %d groups...", len(layout.groups))
                 
                 if progress_callback:
                     progress_callback(80)  # 80% - Starting groups
@@ -345,12 +348,14 @@ class LayoutManager:
                                     groups_processed += 1
                                     break
                         except Exception as e:
-                            print(f"[ERROR] Failed to create group for {group_layout.block1_name} + {group_layout.block2_name}: {e}")
+                            log.error("Failed to create group for %s + %s: %s",
+                                      group_layout.block1_name, group_layout.block2_name, e)
                             continue
                     else:
-                        print(f"[WARNING] Could not find blocks for group: {group_layout.block1_name} and/or {group_layout.block2_name}")
+                        log.warning("Could not find blocks for group: %s and/or %s",
+                                    group_layout.block1_name, group_layout.block2_name)
                 
-                print(f"[DEBUG] Successfully processed {groups_processed}/{len(layout.groups)} groups")
+                log.debug("Successfully processed %d/%d groups", groups_processed, len(layout.groups))
                 
                 if progress_callback:
                     progress_callback(90)  # 90% - Groups completed
@@ -370,13 +375,11 @@ class LayoutManager:
             elif hasattr(patchbay_view, 'patchbay_view') and hasattr(patchbay_view.patchbay_view, 'current_layout_name'):
                 patchbay_view.patchbay_view.current_layout_name = layout.name
             
-            print(f"[DEBUG] Layout {layout.name} applied successfully")
+            log.debug("Layout %s applied successfully", layout.name)
             return True
             
         except Exception as e:
-            print(f"[ERROR] Error applying layout: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error applying layout: %s", e)
             # Make sure to re-enable UI updates even on error
             try:
                 patchbay_view.setUpdatesEnabled(True)
@@ -229,19 +229,18 @@ class OutputsTabs(QWidget):
         # Track which groups need updating
         groups_to_update = set()
         
-        for item in self.patchbay_view.graphics_scene.items():
-            # Update ChannelBlock objects
-            if hasattr(item, 'ctl_name') and hasattr(item, 'update_fader') and hasattr(item, 'fader_value'):
-                val = values.get(item.ctl_name)  # type: ignore
-                if val is not None and val != item.fader_value:  # type: ignore
-                    # Update without triggering ALSA write (skip_alsa=True)
-                    item.fader_value = val  # type: ignore
-                    item.update_fader(skip_alsa=True)  # type: ignore
-                    item.value_text.setPlainText(str(val))  # type: ignore
-                    
-                    # If this block is part of a group, mark the group for updating
-                    if hasattr(item, 'current_group') and item.current_group:  # type: ignore
-                        groups_to_update.add(item.current_group)  # type: ignore
+        # The view keeps every ChannelBlock by control name, so there is no need to
+        # walk (and duck-type) every label, button and fader item in the scene
+        for item in self.patchbay_view.blocks.values():
+            val = values.get(item.ctl_name)
+            if val is not None and val != item.fader_value:
+                # Update without triggering ALSA write (skip_alsa=True)
+                item.fader_value = val
+                item.update_fader(skip_alsa=True)
+                
+                # If this block is part of a group, mark the group for updating
+                if item.current_group:
+                    groups_to_update.add(item.current_group)
         
         # Update groups that contain updated blocks
         for group in groups_to_update:
@@ -285,8 +284,8 @@ class OutputsTabs(QWidget):
         group.crossfader.blockSignals(False)
         
         # Update volume displays
-        group.vol1_text.setPlainText(str(val1))
-        group.vol2_text.setPlainText(str(val2))
+        group.vol1_text.setText(str(val1))
+        group.vol2_text.setText(str(val2))
     
     def _update_all_mute_solo_states(self):
         """Update mute/solo button states across all tabs."""
@@ -1,13 +1,33 @@
-from PyQt6.QtWidgets import QSlider, QStyleOptionSlider
-from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtWidgets import QSlider
+from PyQt6.QtGui import QPainter, QColor, QPixmap, QBrush
 from PyQt6.QtCore import Qt, QRectF
 
 class OvalGrooveSlider(QSlider):
+    _DISABLED_BRUSH = QBrush(QColor(0, 0, 0, 80))
+
     def __init__(self, orientation, handle_color="#3f7fff", groove_color="#222", parent=None):
         super().__init__(orientation, parent)
         self.handle_color = handle_color
         self.groove_color = groove_color
+        self._handle_brush = QBrush(QColor(handle_color))
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        # Groove pixmap cache, keyed by (width, height, groove color, device pixel ratio)
+        self._groove_pixmap = None
+        self._groove_key = None
+        # Geometry is cached per size; the orientation branch is taken once here
+        self._geometry_size = None
+        if orientation == Qt.Orientation.Vertical:
+            self._handle_rect_at = self._vertical_handle_rect
+            self._empty_range_val = 1
+        else:
+            self._handle_rect_at = self._horizontal_handle_rect
+            self._empty_range_val = 0
+
+    def set_handle_color(self, color):
+        """Change the handle color (the brush is built here, not on every paint)."""
+        self.handle_color = color
+        self._handle_brush = QBrush(QColor(color))
+        self.update()
 
     def wheelEvent(self, event):
         # Consistent shift+wheel for fine increments, else normal step
@@ -24,49 +44,77 @@ class OvalGrooveSlider(QSlider):
         else:
             super().wheelEvent(event)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        opt = QStyleOptionSlider()
-        self.initStyleOption(opt)
+    def _groove_pixmap_for(self, groove_rect, radius):
+        """Return the groove rasterized once per size/color instead of on every repaint."""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), self.groove_color, dpr)
+        if self._groove_key != key:
+            pixmap = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            groove_painter = QPainter(pixmap)
+            groove_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            groove_painter.setPen(Qt.PenStyle.NoPen)
+            groove_painter.setBrush(QColor(self.groove_color))
+            groove_painter.drawRoundedRect(groove_rect, radius, radius)
+            groove_painter.end()
+            self._groove_pixmap = pixmap
+            self._groove_key = key
+        return self._groove_pixmap
+
+    def resizeEvent(self, event):
+        # Groove/handle geometry only depends on the widget size, recompute on next paint
+        self._geometry_size = None
+        super().resizeEvent(event)
+
+    def _update_geometry(self):
+        """Cache the groove rect and handle travel for the current size."""
         handle_size = 16
         if self.orientation() == Qt.Orientation.Vertical:
             groove_w = 16
             groove_h = self.height() - 12
             groove_x = (self.width() - groove_w) // 2
             groove_y = 6
-            groove_rect = QRectF(groove_x, groove_y, groove_w, groove_h)
-            radius = groove_w / 2
-            slider_min = groove_y
-            slider_max = groove_y + groove_h - handle_size
-            val = (self.maximum() - self.value()) / (self.maximum() - self.minimum()) if self.maximum() != self.minimum() else 0
-            handle_y = slider_min + val * (slider_max - slider_min)
-            handle_x = (self.width() - handle_size) // 2
-            handle_rect = QRectF(handle_x, handle_y, handle_size, handle_size)
+            self._radius = groove_w / 2
+            self._slider_min = groove_y
+            self._slider_span = groove_h - handle_size
+            self._handle_fixed = (self.width() - handle_size) // 2
         else:
             groove_h = 16
             groove_w = self.width() - 20
             groove_x = 10
             groove_y = (self.height() - groove_h) // 2
-            groove_rect = QRectF(groove_x, groove_y, groove_w, groove_h)
-            radius = groove_h / 2
-            slider_min = groove_x
-            slider_max = groove_x + groove_w - handle_size
-            val = (self.value() - self.minimum()) / (self.maximum() - self.minimum()) if self.maximum() != self.minimum() else 0
-            handle_x = slider_min + val * (slider_max - slider_min)
+            self._radius = groove_h / 2
+            self._slider_min = groove_x
+            self._slider_span = groove_w - handle_size
             handle_y = (self.height() - handle_size) // 2
             if handle_y + handle_size > self.height():
                 handle_y = self.height() - handle_size
             if handle_y < 0:
                 handle_y = 0
-            handle_rect = QRectF(handle_x, handle_y, handle_size, handle_size)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(self.groove_color))
-        painter.drawRoundedRect(groove_rect, radius, radius)
-        painter.setBrush(QColor(self.handle_color))
+            self._handle_fixed = handle_y
+        self._groove_rect = QRectF(groove_x, groove_y, groove_w, groove_h)
+        self._geometry_size = (self.width(), self.height())
+
+    def _vertical_handle_rect(self, val):
+        return QRectF(self._handle_fixed, self._slider_min + (1 - val) * self._slider_span, 16, 16)
+
+    def _horizontal_handle_rect(self, val):
+        return QRectF(self._slider_min + val * self._slider_span, self._handle_fixed, 16, 16)
+
+    def paintEvent(self, event):
+        if self._geometry_size is None:
+            self._update_geometry()
+        span = self.maximum() - self.minimum()
+        val = (self.value() - self.minimum()) / span if span else self._empty_range_val
+        handle_rect = self._handle_rect_at(val)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._groove_pixmap_for(self._groove_rect, self._radius))
+        painter.setBrush(self._handle_brush)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(handle_rect)
         if not self.isEnabled():
-            painter.setBrush(QColor(0, 0, 0, 80))
+            painter.setBrush(self._DISABLED_BRUSH)
             painter.drawEllipse(handle_rect)
-        painter.end() 
\ No newline at end of file
+        painter.end()
@@ -8,21 +8,281 @@ Patchbay2 - Simple, clean patchbay system
 - Right-click to ungroup
 """
 
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, List
 from PyQt6.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QGraphicsWidget, QGraphicsTextItem, QGraphicsRectItem, QGraphicsItem,
+    QGraphicsView, QGraphicsScene, QGraphicsWidget, QGraphicsSimpleTextItem, QGraphicsItem, QGraphicsObject,
     QSlider, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QGraphicsProxyWidget, QApplication, QMainWindow, QPushButton
 )
-from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPainter, QFontMetrics, QWheelEvent, QMouseEvent, QPainterPath
+from PyQt6.QtGui import QBrush, QColor, QPen, QFont, QPainter, QFontMetrics, QFontMetricsF, QWheelEvent, QMouseEvent, QPainterPath, QTransform, QPalette, QPixmap, QOpenGLContext
 from PyQt6.QtWidgets import QGraphicsSceneWheelEvent, QGraphicsSceneMouseEvent
-from PyQt6.QtCore import Qt, QRectF, QTimer, QPointF, QPropertyAnimation, QEasingCurve
-from PyQt6.QtWidgets import QStyleOptionSlider
+from PyQt6.QtCore import Qt, QRectF, QTimer, QPointF, QPropertyAnimation, QEasingCurve, QSignalBlocker, pyqtSignal
 
 import alsa_backend
 import math
 import alsaaudio
 from oval_slider import OvalGrooveSlider
+from mute_solo_manager import get_mute_solo_manager
+
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # PyQt6 built without OpenGL support, stay on the raster viewport
+    QOpenGLWidget = None
+
+
+@lru_cache(maxsize=1)
+def _opengl_available() -> bool:
+    """Whether the platform can create an OpenGL context for the view."""
+    return QOpenGLWidget is not None and QOpenGLContext().create()
+
+log = logging.getLogger(__name__)
+
+
+# Constant-power pan law (left, right) for every crossfader position 0..100
+_PAN_LUT = tuple((math.cos(v / 100 * math.pi / 2), math.sin(v / 100 * math.pi / 2)) for v in range(101))
+
+# QTextDocument's default margin around QGraphicsTextItem contents
+_TEXT_MARGIN = 4.0
+
+
+@lru_cache(maxsize=8)
+def _font_for(font_key: tuple) -> QFont:
+    """Build a font from a (family, point size, bold) key."""
+    family, size, bold = font_key
+    return QFont(family, size, QFont.Weight.Bold if bold else QFont.Weight.Normal)
+
+
+@lru_cache(maxsize=8)
+def _metrics_for(font_key: tuple) -> QFontMetricsF:
+    """Font metrics for a font key, shared by every text measurement."""
+    return QFontMetricsF(_font_for(font_key))
+
+
+@lru_cache(maxsize=512)
+def _text_width(font_key: tuple, text: str) -> float:
+    """Width of a QGraphicsTextItem showing text, without a layout pass."""
+    return _metrics_for(font_key).horizontalAdvance(text) + 2 * _TEXT_MARGIN
+
+
+@lru_cache(maxsize=8)
+def _text_height(font_key: tuple) -> float:
+    """Height of a single-line QGraphicsTextItem in the given font."""
+    return math.ceil(_metrics_for(font_key).height()) + 2 * _TEXT_MARGIN
+
+
+class CircleButtonItem(QGraphicsObject):
+    """Small round control button painted directly in the scene (no proxy widget)."""
+    
+    clicked = pyqtSignal()
+    
+    SIZE = 20
+    
+    # Shared paint resources
+    _BORDER_PEN = QPen(QColor("#333"), 2)
+    _HOVER_PEN = QPen(QColor("#666"), 2)
+    _TEXT_PEN = QPen(QColor("white"))
+    _FONT = QFont("Sans")
+    _FONT.setPixelSize(6)
+    _FONT.setBold(True)
+    _BRUSHES = {}  # (color, alpha) -> QBrush
+    # Every button has the same size, so the geometry is shared too
+    _RECT = QRectF(0, 0, SIZE, SIZE)
+    _ELLIPSE_RECT = _RECT.adjusted(1, 1, -1, -1)
+    
+    def __init__(self, text: str, color: str, parent: Optional[QGraphicsItem] = None):
+        super().__init__(parent)
+        self.text = text
+        self.color = color
+        self._hovered = False
+        self._pressed = False
+        self.setAcceptHoverEvents(True)
+        self.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)
+    
+    @classmethod
+    def _brush(cls, color: str, alpha: int) -> QBrush:
+        """Return a cached brush for the given color and alpha."""
+        key = (color, alpha)
+        brush = cls._BRUSHES.get(key)
+        if brush is None:
+            qcolor = QColor(color)
+            qcolor.setAlpha(alpha)
+            brush = cls._BRUSHES[key] = QBrush(qcolor)
+        return brush
+    
+    def set_color(self, color: str):
+        """Change the fill color, repainting only if it differs."""
+        if color != self.color:
+            self.color = color
+            self.update()
+    
+    def boundingRect(self) -> QRectF:
+        return self._RECT
+    
+    def paint(self, painter: Optional[QPainter], option, widget=None):
+        if not painter:
+            return
+        # Same alpha steps as the old :hover / :pressed stylesheet states
+        if self._pressed:
+            alpha = 0x77
+        elif self._hovered:
+            alpha = 0xaa
+        else:
+            alpha = 0xff
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._HOVER_PEN if self._hovered else self._BORDER_PEN)
+        painter.setBrush(self._brush(self.color, alpha))
+        painter.drawEllipse(self._ELLIPSE_RECT)
+        painter.setPen(self._TEXT_PEN)
+        painter.setFont(self._FONT)
+        painter.drawText(self._RECT, Qt.AlignmentFlag.AlignCenter, self.text)
+    
+    def hoverEnterEvent(self, event):
+        self._hovered = True
+        self.update()
+    
+    def hoverLeaveEvent(self, event):
+        self._hovered = False
+        self.update()
+    
+    def mousePressEvent(self, event: Optional[QGraphicsSceneMouseEvent]):
+        if event and event.button() == Qt.MouseButton.LeftButton:
+            self._pressed = True
+            self.update()
+            event.accept()
+        else:
+            super().mousePressEvent(event)
+    
+    def mouseReleaseEvent(self, event: Optional[QGraphicsSceneMouseEvent]):
+        if event and self._pressed:
+            self._pressed = False
+            self.update()
+            if self._RECT.contains(event.pos()):
+                self.clicked.emit()
+            event.accept()
+        else:
+            super().mouseReleaseEvent(event)
+
+
+class OvalGrooveFaderItem(QGraphicsObject):
+    """Vertical oval-groove fader painted directly in the scene (no proxy widget)."""
+    
+    valueChanged = pyqtSignal(int)
+    
+    HANDLE_SIZE = 16
+    GROOVE_WIDTH = 16
+    GROOVE_RADIUS = GROOVE_WIDTH / 2
+    PAGE_STEP = 10
+    
+    _DISABLED_BRUSH = QBrush(QColor(0, 0, 0, 80))
+    _BRUSHES = {}  # color -> QBrush, shared by every fader
+    
+    def __init__(self, width: int, height: int, handle_color: str = "#3f7fff", groove_color: str = "#222",
+                 parent: Optional[QGraphicsItem] = None):
+        super().__init__(parent)
+        self._rect = QRectF(0, 0, width, height)
+        self._minimum = 0
+        self._maximum = 100
+        self._value = 0
+        self._drag_offset = None
+        self._handle_brush = self._brush(handle_color)
+        self._groove_brush = self._brush(groove_color)
+        
+        # Groove/handle geometry is fixed for the item's lifetime
+        self._groove_rect = QRectF((width - self.GROOVE_WIDTH) // 2, 6, self.GROOVE_WIDTH, height - 12)
+        self._slider_min = 6
+        self._slider_max = 6 + (height - 12) - self.HANDLE_SIZE
+        self._travel = self._slider_max - self._slider_min
+        self._handle_x = (width - self.HANDLE_SIZE) // 2
+        
+        self.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)
+    
+    @classmethod
+    def _brush(cls, color: str) -> QBrush:
+        """Return a cached brush for the given color."""
+        brush = cls._BRUSHES.get(color)
+        if brush is None:
+            brush = cls._BRUSHES[color] = QBrush(QColor(color))
+        return brush
+    
+    def value(self) -> int:
+        return self._value
+    
+    def setRange(self, minimum: int, maximum: int):
+        self._minimum = minimum
+        self._maximum = max(minimum, maximum)
+        self.setValue(self._value)
+    
+    def setValue(self, value: int):
+        """Set the fader value, emitting valueChanged only when it changes."""
+        value = max(self._minimum, min(self._maximum, int(value)))
+        if value != self._value:
+            self._value = value
+            self.update()
+            self.valueChanged.emit(value)
+    
+    def _handle_rect(self) -> QRectF:
+        span = self._maximum - self._minimum
+        ratio = (self._maximum - self._value) / span if span else 0
+        handle_y = self._slider_min + ratio * self._travel
+        return QRectF(self._handle_x, handle_y, self.HANDLE_SIZE, self.HANDLE_SIZE)
+    
+    def _value_at(self, handle_y: float) -> int:
+        """Map a handle top position back to a fader value."""
+        if self._travel <= 0:
+            return self._value
+        ratio = min(max((handle_y - self._slider_min) / self._travel, 0.0), 1.0)
+        return round(self._maximum - ratio * (self._maximum - self._minimum))
+    
+    def boundingRect(self) -> QRectF:
+        return self._rect
+    
+    def paint(self, painter: Optional[QPainter], option, widget=None):
+        if not painter:
+            return
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        
+        # Draw groove (oval)
+        painter.setBrush(self._groove_brush)
+        painter.drawRoundedRect(self._groove_rect, self.GROOVE_RADIUS, self.GROOVE_RADIUS)
+        
+        # Draw handle (circle)
+        handle_rect = self._handle_rect()
+        painter.setBrush(self._handle_brush)
+        painter.drawEllipse(handle_rect)
+        if not self.isEnabled():
+            painter.setBrush(self._DISABLED_BRUSH)
+            painter.drawEllipse(handle_rect)
+    
+    def mousePressEvent(self, event: Optional[QGraphicsSceneMouseEvent]):
+        if not event or event.button() != Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+        handle_rect = self._handle_rect()
+        y = event.pos().y()
+        if handle_rect.contains(event.pos()):
+            # Grab the handle and drag it
+            self._drag_offset = y - handle_rect.top()
+        elif y < handle_rect.top():
+            self.setValue(self._value + self.PAGE_STEP)
+        else:
+            self.setValue(self._value - self.PAGE_STEP)
+        event.accept()
+    
+    def mouseMoveEvent(self, event: Optional[QGraphicsSceneMouseEvent]):
+        if event and self._drag_offset is not None:
+            self.setValue(self._value_at(event.pos().y() - self._drag_offset))
+            event.accept()
+        else:
+            super().mouseMoveEvent(event)
+    
+    def mouseReleaseEvent(self, event: Optional[QGraphicsSceneMouseEvent]):
+        self._drag_offset = None
+        if event:
+            event.accept()
 
 
 class ChannelBlock(QGraphicsWidget):
@@ -31,17 +291,37 @@ class ChannelBlock(QGraphicsWidget):
     WIDTH = 120
     HEIGHT = 120  # Increased to match group widget
     
-    def __init__(self, ctl_name: str, mixer: alsaaudio.Mixer, show_fader: bool = True):
+    # Shared paint resources (built once instead of on every repaint)
+    _PEN_GOLD_1 = QPen(QColor("#FFD700"), 1)
+    _PEN_GOLD_SEL = QPen(QColor("#FFD700"), 3)
+    _BRUSH_OUTPUT = QBrush(QColor("#4a2a2a"))  # Soft red for main outputs
+    _BRUSH_INPUT = QBrush(QColor("#2e3036"))  # Lighter Bitwig-style dark grey for inputs
+    _LABEL_BRUSH = QBrush(QColor("#FFD700"))  # Gold like group widget
+    _VALUE_BRUSH = QBrush(QColor("#3f7fff"))  # Blue like crossfader
+    # (family, point size, bold) keys, matching the group widget font sizes
+    _LABEL_FONT = ("Sans", 7, True)
+    _VALUE_FONT = ("Sans", 7, False)
+    # Outlines for straightened edges, keyed by (left_straight, right_straight, radius)
+    _PATH_CACHE = {}
+    # Blocks never change size, so the body rects are fixed too
+    _BODY_RECT = QRectF(0, 0, WIDTH, HEIGHT)
+    _SELECTED_RECT = _BODY_RECT.adjusted(1, 1, -1, -1)
+    
+    def __init__(self, ctl_name: str, mixer: alsaaudio.Mixer, show_fader: bool = True,
+                 fader_value: Optional[int] = None):
         super().__init__()
         self.ctl_name = ctl_name
         self.mixer = mixer
         self.show_fader = show_fader
         
-        # Get initial volume from ALSA
-        try:
-            self.fader_value = mixer.getvolume()[0]
-        except:
-            self.fader_value = 50
+        # Get initial volume from ALSA unless the caller already knows it
+        if fader_value is not None:
+            self.fader_value = fader_value
+        else:
+            try:
+                self.fader_value = mixer.getvolume()[0]
+            except:
+                self.fader_value = 50
         
         # Determine channel type for control buttons
         self.channel_type = self._determine_channel_type(ctl_name)
@@ -51,6 +331,8 @@ class ChannelBlock(QGraphicsWidget):
         self.muted = False
         self.soloed = False
         self.pre_mute_volume = self.fader_value  # Store volume before mute
+        self._flush_scheduled = False  # Pending deferred button refresh
+        self._mute_solo_manager = get_mute_solo_manager()
         
 
         
@@ -58,36 +340,31 @@ class ChannelBlock(QGraphicsWidget):
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
         self.setZValue(1)
+        # Blit the rounded body from an offscreen cache; update() invalidates it
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setGeometry(QRectF(0, 0, self.WIDTH, self.HEIGHT))
         
         # Create main label - match group widget font size
-        label_font = QFont("Sans", 7, QFont.Weight.Bold)  # Match group widget font size
-        self.label = QGraphicsTextItem(ctl_name, self)
-        self.label.setFont(label_font)
-        self.label.setDefaultTextColor(QColor("#FFD700"))  # Gold like group widget
+        self.label = QGraphicsSimpleTextItem(ctl_name, self)
+        self.label.setFont(_font_for(self._LABEL_FONT))
+        self.label.setBrush(self._LABEL_BRUSH)
+        # The name never changes: lay it out once and blit the rendered text afterwards
+        self.label.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         
         # Center the label at top
-        label_rect = self.label.boundingRect()
-        label_x = (self.WIDTH - label_rect.width()) / 2
+        label_x = (self.WIDTH - _text_width(self._LABEL_FONT, ctl_name)) / 2
         label_y = 5
-        self.label.setPos(label_x, label_y)
-        
-        # Value display - create first (moved up to ensure it exists before fader)
-        value_font = QFont("Sans", 7)  # Match group volume indicator font size
-        self.value_text = QGraphicsTextItem(str(int(self.fader_value)), self)
-        self.value_text.setFont(value_font)
-        self.value_text.setDefaultTextColor(QColor("#3f7fff"))  # Blue like crossfader
-        
-        # Create fader/value before control buttons (matches patchbay2.py)
-        if self.show_fader:
-            self._create_fader()
-        else:
-            value_rect = self.value_text.boundingRect()
-            value_x = (self.WIDTH - value_rect.width()) / 2
-            self.value_text.setPos(value_x, self.HEIGHT - 25)
-        
-        # Create controls
-        self._create_control_buttons()
+        self.label.setPos(label_x + _TEXT_MARGIN, label_y + _TEXT_MARGIN)
+        
+        # Value display, fader and control buttons are created lazily by
+        # _ensure_visuals() once the block is shown inside the view's viewport
+        # (grouped and scrolled-off blocks skip them)
+        self.value_text = None
+        self.fader_slider = None
+        self._was_hidden = False
+        # Fader drags are written to ALSA at most once per timer tick
+        self._pending_volume = None
+        self._alsa_timer = None  # Created on the first drag
         
         # Group state
         self.current_group = None
@@ -107,10 +384,7 @@ class ChannelBlock(QGraphicsWidget):
         # Use full ALSA control name for display
         display_name = ctl_name
         
-        # Connect to mute_solo_manager state_changed signal
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
-        manager.state_changed.connect(self.update_mute_solo_state)
+        # Mute/solo updates are dispatched by the owning PatchbayView
 
     
     def _determine_channel_type(self, ctl_name: str) -> str:
@@ -165,14 +439,7 @@ class ChannelBlock(QGraphicsWidget):
             self._create_button("S", start_x, start_y + button_size + button_gap, "#44ff44", "Solo")
     
     def _create_button(self, text: str, x: float, y: float, color: str, tooltip: str):
-        """Create a small rounded control button."""
-        button_size = 20  # Was 14
-        
-        # Create rounded button using custom painting in a proxy widget
-        button = QPushButton(text)
-        button.setFixedSize(button_size, button_size)
-        button.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        
+        """Create a small round control button."""
         # Set initial state based on current mute/solo state
         is_active = False
         if text == "M":
@@ -189,101 +456,113 @@ class ChannelBlock(QGraphicsWidget):
         else:
             active_color = color
         
-        # When setting style for mute/solo buttons, always use button.width()//2 for border-radius
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                background-color: {active_color};
-                color: white;
-                border: 2px solid #333;
-                border-radius: {button.width()//2}px;
-                font-size: 6px;
-                font-weight: bold;
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {active_color}aa;
-                border: 2px solid #666;
-            }}
-            QPushButton:pressed {{
-                background-color: {active_color}77;
-            }}
-        """)
+        button = CircleButtonItem(text, active_color, self)
+        button.setPos(x, y)
+        button.setToolTip(tooltip)
         
         # Add click handlers for mute and solo buttons
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
         if text == "M":
             button.clicked.connect(self._on_mute_clicked)
-            manager.flash_state_changed.connect(self._update_mute_flash)
         elif text == "S":
             button.clicked.connect(self._on_solo_clicked)
-            manager.flash_state_changed.connect(self._update_solo_flash)
-        
-        # Add button to scene via proxy with transparent background
-        button_proxy = QGraphicsProxyWidget(self)
-        button_proxy.setWidget(button)
-        button_proxy.setPos(x, y)
-        button_proxy.setAutoFillBackground(False)
-        from PyQt6.QtGui import QPalette
-        palette = button_proxy.palette()
-        palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.transparent)
-        button_proxy.setPalette(palette)
         
         # Store references
-        self.control_buttons.append((button_proxy, button, tooltip))
+        self.control_buttons.append((button, tooltip))
+    
+    def _ensure_visuals(self):
+        """Create the value display, fader and control buttons on first use."""
+        if self.value_text is not None:
+            return
+        
+        self._create_control_buttons()
+        if self.muted or self.soloed:
+            self._update_button_states()
+        
+        value_str = str(int(self.fader_value))
+        # Plain text items (no QTextDocument); positions keep the old document margin
+        self.value_text = QGraphicsSimpleTextItem(value_str, self)
+        self.value_text.setFont(_font_for(self._VALUE_FONT))
+        self.value_text.setBrush(self._VALUE_BRUSH)
+        
+        if self.show_fader:
+            self._create_fader()
+        else:
+            value_x = (self.WIDTH - _text_width(self._VALUE_FONT, value_str)) / 2
+            self.value_text.setPos(value_x + _TEXT_MARGIN, self.HEIGHT - 25 + _TEXT_MARGIN)
+    
+    def itemChange(self, change, value):
+        """Build the lazy visuals when a hidden (grouped) block is shown again."""
+        if change == QGraphicsItem.GraphicsItemChange.ItemVisibleHasChanged:
+            # Scene polish also reports visibility for every block; only an
+            # explicit hide/show (grouping) means the block is where the user is
+            if not self.isVisible():
+                self._was_hidden = True
+            elif self._was_hidden and self.scene():
+                self._ensure_visuals()
+        return super().itemChange(change, value)
     
     def _create_fader(self):
-        """Create the fader using QSlider for consistent styling."""
+        """Create the fader as a native scene item with the same styling as group widgets."""
         gap = 15
         block_height = self.HEIGHT
         fader_height = 100
         fader_x = self.WIDTH - 20 - gap  # Right side with gap
         fader_y_centered = (block_height - fader_height) // 2
 
-        # Create QSlider with same styling as group widgets
-        self.fader_slider = OvalGrooveSlider(Qt.Orientation.Vertical, handle_color="#3f7fff", groove_color="#222")
+        self.fader_slider = OvalGrooveFaderItem(20, fader_height, handle_color="#3f7fff", groove_color="#222", parent=self)
         self.fader_slider.setRange(0, 100)
         self.fader_slider.setValue(self.fader_value)
-        self.fader_slider.setFixedSize(20, fader_height)
+        self.fader_slider.setPos(fader_x, fader_y_centered)
         self.fader_slider.valueChanged.connect(self._on_fader_changed)
 
-        # Add slider to graphics scene via proxy
-        self.fader_proxy = QGraphicsProxyWidget(self)
-        self.fader_proxy.setWidget(self.fader_slider)
-        self.fader_proxy.setPos(fader_x, fader_y_centered)
-
         # Value readout stacked vertically to the left of fader
-        value_rect = self.value_text.boundingRect()
-        value_x = fader_x - value_rect.width() - 6  # 6px gap to left of fader
-        value_y = fader_y_centered + (fader_height - value_rect.height()) / 2
-        self.value_text.setPos(value_x, value_y)
+        value_width = _text_width(self._VALUE_FONT, str(int(self.fader_value)))
+        value_x = fader_x - value_width - 6  # 6px gap to left of fader
+        value_y = fader_y_centered + (fader_height - _text_height(self._VALUE_FONT)) / 2
+        self.value_text.setPos(value_x + _TEXT_MARGIN, value_y + _TEXT_MARGIN)
     
     def _on_fader_changed(self, value: int):
         """Handle fader value changes."""
         self.fader_value = value
-        # Update ALSA hardware
+        # Coalesce drag steps into one ALSA write per tick (latest value wins)
+        self._pending_volume = value
+        if self._alsa_timer is None:
+            self._alsa_timer = QTimer(self)
+            self._alsa_timer.setSingleShot(True)
+            self._alsa_timer.setInterval(16)
+            self._alsa_timer.timeout.connect(self._flush_alsa)
+        if not self._alsa_timer.isActive():
+            self._alsa_timer.start()
+        
+        # Update display
+        self.value_text.setText(str(value))
+    
+    def _flush_alsa(self):
+        """Write the most recent fader value to ALSA."""
+        if self._pending_volume is None:
+            return
+        value, self._pending_volume = self._pending_volume, None
         try:
             self.mixer.setvolume(value)
         except Exception as e:
-            print(f"[ERROR] Failed to set ALSA volume for {self.ctl_name}: {e}")
-        
-        # Update display
-        self.value_text.setPlainText(str(value))
+            log.error("Failed to set ALSA volume for %s: %s", self.ctl_name, e)
     
     def update_fader(self, skip_alsa: bool = False):
         """Update the fader display."""
-        if self.show_fader and hasattr(self, 'fader_slider'):
-            # Update slider value without triggering valueChanged signal
-            self.fader_slider.blockSignals(True)
-            self.fader_slider.setValue(int(self.fader_value))
-            self.fader_slider.blockSignals(False)
-        
-        self.value_text.setPlainText(str(int(self.fader_value)))
+        value = int(self.fader_value)
+        if self.value_text is not None:
+            if self.fader_slider is not None and self.fader_slider.value() != value:
+                # Update slider value without triggering valueChanged signal
+                with QSignalBlocker(self.fader_slider):
+                    self.fader_slider.setValue(value)
+            
+            self.value_text.setText(str(value))
         
+        # Always written: the mute manager and mixer tabs change the same control
         if not skip_alsa:
+            self._pending_volume = None  # Superseded by this write
             try:
-                self.mixer.setvolume(int(self.fader_value))
+                self.mixer.setvolume(value)
             except Exception:
                 pass
     
@@ -308,36 +587,20 @@ class ChannelBlock(QGraphicsWidget):
         else:
             super().keyPressEvent(event)
     
-    def paint(self, painter: Optional[QPainter], option, widget):
-        """Custom painting for selection highlighting and corner animation."""
-        if not painter:
-            return
-            
-        painter.setBackgroundMode(Qt.BGMode.OpaqueMode)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw rounded background with selective corner straightening
-        painter.setPen(QPen(QColor("#FFD700"), 2 if self.isSelected() else 1))
-        
-        # Use different background colors based on channel type
-        if self.is_output:
-            bg_color = QColor("#4a2a2a")  # Soft red for main outputs
-        else:
-            bg_color = QColor("#2e3036")  # Lighter Bitwig-style dark grey for inputs
-        
-        painter.setBrush(QBrush(bg_color))
-        
-        # Create custom rounded rectangle with selective corners
-        rect = self.boundingRect()
-        if self.left_edge_straight or self.right_edge_straight:
-            # Custom path for selective corner rounding
+    @classmethod
+    def _edge_path(cls, left_straight: bool, right_straight: bool, radius: float) -> QPainterPath:
+        """Return the cached outline for a block with straightened edges."""
+        key = (left_straight, right_straight, radius)
+        path = cls._PATH_CACHE.get(key)
+        if path is None:
+            rect = cls._BODY_RECT
             path = QPainterPath()
             
             # Start from top-left, going clockwise
-            top_left_radius = 0 if self.left_edge_straight else self.corner_radius
-            top_right_radius = 0 if self.right_edge_straight else self.corner_radius
-            bottom_right_radius = 0 if self.right_edge_straight else self.corner_radius
-            bottom_left_radius = 0 if self.left_edge_straight else self.corner_radius
+            top_left_radius = 0 if left_straight else radius
+            top_right_radius = 0 if right_straight else radius
+            bottom_right_radius = 0 if right_straight else radius
+            bottom_left_radius = 0 if left_straight else radius
             
             # Top edge
             path.moveTo(rect.left() + top_left_radius, rect.top())
@@ -373,16 +636,33 @@ class ChannelBlock(QGraphicsWidget):
                           2*top_left_radius, 2*top_left_radius, 180, -90)
             
             path.closeSubpath()
-            painter.drawPath(path)
-        else:
-            # Standard rounded rectangle
-            painter.drawRoundedRect(rect, self.corner_radius, self.corner_radius)
+            cls._PATH_CACHE[key] = path
+        return path
+    
+    def paint(self, painter: Optional[QPainter], option, widget):
+        """Custom painting for selection highlighting and corner animation."""
+        if not painter:
+            return
+        
+        # Rounded corners need antialiasing; the view itself no longer enables it
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Use different background colors based on channel type
+        painter.setBrush(self._BRUSH_OUTPUT if self.is_output else self._BRUSH_INPUT)
         
-        # Draw selection highlight if selected
         if self.isSelected():
-            painter.setPen(QPen(QColor("#FFD700"), 3))
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRoundedRect(self.boundingRect().adjusted(1, 1, -1, -1), self.corner_radius, self.corner_radius)
+            # Fill and selection outline in a single pass
+            painter.setPen(self._PEN_GOLD_SEL)
+            painter.drawRoundedRect(self._SELECTED_RECT, self.corner_radius, self.corner_radius)
+        elif self.left_edge_straight or self.right_edge_straight:
+            # Selective corner rounding uses one of three cached paths
+            painter.setPen(self._PEN_GOLD_1)
+            painter.drawPath(self._edge_path(self.left_edge_straight, self.right_edge_straight,
+                                             self.corner_radius))
+        else:
+            # Standard rounded rectangle
+            painter.setPen(self._PEN_GOLD_1)
+            painter.drawRoundedRect(self._BODY_RECT, self.corner_radius, self.corner_radius)
     
     def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         """Handle mouse release for potential grouping."""
@@ -393,23 +673,30 @@ class ChannelBlock(QGraphicsWidget):
             scene = self.scene()
             if scene and not self.current_group:
                 snap_distance = 30
+                width = self.WIDTH
                 my_pos = self.pos()
-                my_rect = QRectF(my_pos.x(), my_pos.y(), 120, 120)
+                my_left = my_pos.x()
+                my_right = my_left + width
+                my_y = my_pos.y()
                 
-                # Check for blocks to snap to
-                for item in scene.items():
+                # Only consider blocks within snap range (BSP-indexed spatial query)
+                search_rect = QRectF(my_left - snap_distance, my_y - snap_distance,
+                                     width + 2 * snap_distance, self.HEIGHT + 2 * snap_distance)
+                for item in scene.items(search_rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect):
                     if isinstance(item, ChannelBlock) and item != self and not item.current_group:
+                        # All blocks share the same fixed size, so compare scalars directly
                         other_pos = item.pos()
-                        other_rect = QRectF(other_pos.x(), other_pos.y(), 120, 120)
+                        other_x = other_pos.x()
+                        other_y = other_pos.y()
+                        
+                        # Centers must be vertically aligned (this also implies vertical overlap)
+                        if abs(my_y - other_y) >= snap_distance:
+                            continue
                         
                         # Check for left edge snapping (my right edge to their left edge)
-                        vertical_overlap = min(my_rect.bottom(), other_rect.bottom()) - max(my_rect.top(), other_rect.top())
-                        if (abs(my_rect.right() - other_rect.left()) < snap_distance and
-                            abs(my_rect.center().y() - other_rect.center().y()) < snap_distance and
-                            vertical_overlap >= 1):
+                        if abs(my_right - other_x) < snap_distance:
                             # Snap to left edge
-                            target_pos = QPointF(other_rect.left() - 120, other_rect.y())
-                            self.setPos(target_pos)
+                            self.setPos(other_x - width, other_y)
                             # Set edge straightening for both blocks
                             self.right_edge_straight = True
                             item.left_edge_straight = True
@@ -417,12 +704,9 @@ class ChannelBlock(QGraphicsWidget):
                             self._create_group(item, 'left')
                             break
                         # Check for right edge snapping (my left edge to their right edge)
-                        elif (abs(my_rect.left() - other_rect.right()) < snap_distance and
-                              abs(my_rect.center().y() - other_rect.center().y()) < snap_distance and
-                              vertical_overlap >= 1):
+                        elif abs(my_left - (other_x + width)) < snap_distance:
                             # Snap to right edge
-                            target_pos = QPointF(other_rect.right(), other_rect.y())
-                            self.setPos(target_pos)
+                            self.setPos(other_x + width, other_y)
                             # Set edge straightening for both blocks
                             self.left_edge_straight = True
                             item.right_edge_straight = True
@@ -444,7 +728,7 @@ class ChannelBlock(QGraphicsWidget):
         if not scene:
             return
             
-        print(f"[DEBUG] Creating group: {self.ctl_name} + {other_block.ctl_name}")
+        log.debug("Creating group: %s + %s", self.ctl_name, other_block.ctl_name)
         
         # Position the group widget to cover both blocks seamlessly
         if position == 'left':
@@ -456,12 +740,8 @@ class ChannelBlock(QGraphicsWidget):
             group_pos = other_block.pos()
             left_block, right_block = other_block, self
         
-        # Create group widget - get mixer from the scene's view
-        scene_view = None
-        for view in scene.views():
-            if isinstance(view, PatchbayView):
-                scene_view = view
-                break
+        # Create group widget - get mixer from the scene's owning view
+        scene_view = getattr(scene, 'patchbay_view', None)
         
         if scene_view:
             group = GroupWidget(left_block, right_block, scene_view)
@@ -489,53 +769,30 @@ class ChannelBlock(QGraphicsWidget):
         else:
             step_size = 5
         new_value = min(max(self.fader_value + direction * step_size, 0), 100)
+        event.accept()
+        if new_value == self.fader_value:
+            return  # Already at the end of the range
         self.fader_value = new_value
         self.update_fader()
-        event.accept()
 
     def _on_mute_clicked(self):
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
+        manager = self._mute_solo_manager
         new_mute_state = not manager.get_mute_state(self.ctl_name)
         manager.set_mute(self.ctl_name, new_mute_state, explicit=True)
         self.update_mute_solo_state()
 
     def _on_solo_clicked(self):
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
+        manager = self._mute_solo_manager
         new_solo_state = not manager.get_solo_state(self.ctl_name)
         manager.set_solo(self.ctl_name, new_solo_state, explicit=True)
         self.update_mute_solo_state()
 
     def _update_button_states(self):
-        for button_proxy, button, tooltip in self.control_buttons:
+        for button, tooltip in self.control_buttons:
             if tooltip in ("Group Mute", "Mute"):
-                is_active = self.muted
-                color = "#ff0000" if is_active else "#888888"
+                button.set_color("#ff0000" if self.muted else "#888888")
             elif tooltip in ("Group Solo", "Solo"):
-                is_active = self.soloed
-                color = "#ffe066" if is_active else "#888888"
-            else:
-                continue
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    background-color: {color};
-                    color: white;
-                    border: 2px solid #333;
-                    border-radius: {button.width()//2}px;
-                    font-size: 6px;
-                    font-weight: bold;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{
-                    background-color: {color}aa;
-                    border: 2px solid #666;
-                }}
-                QPushButton:pressed {{
-                    background-color: {color}77;
-                }}
-            """)
+                button.set_color("#ffe066" if self.soloed else "#888888")
 
     def _update_mute_flash(self, flash_on: bool):
         if not self.muted:
@@ -543,105 +800,93 @@ class ChannelBlock(QGraphicsWidget):
             return
         if hasattr(self, 'explicit_mute') and self.explicit_mute:
             # Solid red for explicit mute
-            for button_proxy, button, tooltip in self.control_buttons:
-                if tooltip in ("Group Mute", "Mute"):
-                    color = "#ff0000"
-                    button.setStyleSheet(f"""
-                        QPushButton {{
-                            background: transparent;
-                            background-color: {color};
-                            color: white;
-                            border: 2px solid #333;
-                            border-radius: {button.width()//2}px;
-                            font-size: 6px;
-                            font-weight: bold;
-                            padding: 0px;
-                        }}
-                        QPushButton:hover {{
-                            background-color: {color}aa;
-                            border: 2px solid #666;
-                        }}
-                        QPushButton:pressed {{
-                            background-color: {color}77;
-                        }}
-                    """)
-            return
-        # Flashing for mute-by-solo-logic
-        for button_proxy, button, tooltip in self.control_buttons:
+            color = "#ff0000"
+        else:
+            # Flashing for mute-by-solo-logic
+            color = "#ff0000" if flash_on else "#660000"
+        for button, tooltip in self.control_buttons:
             if tooltip in ("Group Mute", "Mute"):
-                color = "#ff0000" if flash_on else "#660000"
-                button.setStyleSheet(f"""
-                    QPushButton {{
-                        background: transparent;
-                        background-color: {color};
-                        color: white;
-                        border: 2px solid #333;
-                        border-radius: {button.width()//2}px;
-                        font-size: 6px;
-                        font-weight: bold;
-                        padding: 0px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {color}aa;
-                        border: 2px solid #666;
-                    }}
-                    QPushButton:pressed {{
-                        background-color: {color}77;
-                    }}
-                """)
+                button.set_color(color)
 
     def _update_solo_flash(self, flash_on: bool):
         if not self.soloed:
             self._update_button_states()
             return
-        for button_proxy, button, tooltip in self.control_buttons:
+        color = "#ffe066" if flash_on else "#7a6a00"
+        for button, tooltip in self.control_buttons:
             if tooltip in ("Group Solo", "Solo"):
-                color = "#ffe066" if flash_on else "#7a6a00"
-                button.setStyleSheet(f"""
-                    QPushButton {{
-                        background: transparent;
-                        background-color: {color};
-                        color: white;
-                        border: 2px solid #333;
-                        border-radius: {button.width()//2}px;
-                        font-size: 6px;
-                        font-weight: bold;
-                        padding: 0px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {color}aa;
-                        border: 2px solid #666;
-                    }}
-                    QPushButton:pressed {{
-                        background-color: {color}77;
-                    }}
-                """)
+                button.set_color(color)
 
     def update_mute_solo_state(self):
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
+        manager = self._mute_solo_manager
         self.muted = manager.get_mute_state(self.ctl_name)
         self.soloed = manager.get_solo_state(self.ctl_name)
         # Store explicit mute state for correct flashing logic
         self.explicit_mute = False
         if self.ctl_name in manager.channel_states:
             self.explicit_mute = manager.channel_states[self.ctl_name].explicit_mute
+        self._schedule_button_refresh()
+
+    def _schedule_button_refresh(self):
+        """Coalesce repeated state updates into one button refresh per event-loop turn."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_button_states)
+
+    def _flush_button_states(self):
+        self._flush_scheduled = False
         self._update_button_states()
 
 
 class GroupWidget(QGraphicsWidget):
     """Group widget that contains controls for grouped channels."""
     
+    # Shared paint resources (built once instead of on every repaint)
+    _PEN = QPen(QColor("#FFD700"), 2)
+    _BRUSH_OUTPUT = QBrush(QColor("#4a2a2a"))  # Soft red for output groups
+    _BRUSH_INPUT = QBrush(QColor("#2e3036"))  # Lighter Bitwig-style dark grey for input groups
+    _NAME_BRUSH = QBrush(QColor("#FFD700"))
+    _VOL1_BRUSH = QBrush(QColor("#3f7fff"))  # Matches the crossfader handle
+    _VOL2_BRUSH = QBrush(QColor("#ff3f7f"))  # Matches the macro fader handle
+    
+    # Button stylesheets are parsed once; flashing only switches the flashState property
+    _BUTTON_BASE_STYLE = """
+        QPushButton {
+            background: transparent;
+            color: white;
+            border: 2px solid #333;
+            border-radius: 10px;
+            font-size: 6px;
+            font-weight: bold;
+            padding: 0px;
+        }
+    """
+    _BUTTON_STATE_COLORS = {
+        "M": {"off": "#888888", "on": "#ff0000", "dim": "#660000"},
+        "S": {"off": "#888888", "on": "#ffe066", "dim": "#7a6a00"},
+    }
+    _BUTTON_STYLES = {}
+    
     def __init__(self, block1: ChannelBlock, block2: ChannelBlock, view: 'PatchbayView'):
         super().__init__()
         self.block1 = block1
         self.block2 = block2
         self.view = view
+        self._flush_scheduled = False  # Pending deferred button refresh
+        self._mute_solo_manager = get_mute_solo_manager()
+        # flash_state_changed is only connected while the group is actually flashing
+        self._flash_connected_mute = False
+        self._flash_connected_solo = False
         
         # Setup graphics
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
         self.setZValue(10)
+        # The rounded background never changes, so rasterize it once and blit
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        
+        # Output groups (either block is a main output) get the soft red background
+        self._bg_brush = self._BRUSH_OUTPUT if (block1.is_output or block2.is_output) else self._BRUSH_INPUT
         
         # Calculate size and position
         self._setup_geometry()
@@ -649,10 +894,25 @@ class GroupWidget(QGraphicsWidget):
         # Create controls
         self._create_controls()
         
+        # Fader drags update the display at once but write ALSA at most ~60 times a second
+        self._pending_volumes = None
+        self._alsa_timer = QTimer(self)
+        self._alsa_timer.setSingleShot(True)
+        self._alsa_timer.setInterval(16)
+        self._alsa_timer.timeout.connect(self._flush_alsa)
+        
         # Connect signals
         self.crossfader.valueChanged.connect(self._on_crossfader_changed)
         self.macro_fader.valueChanged.connect(self._on_macro_fader_changed)
         
+        # Wheel bursts are coalesced so fast scrolling writes ALSA about once per frame
+        self._wheel_accum = 0
+        self._wheel_target = None
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(20)
+        self._wheel_timer.timeout.connect(self._apply_wheel_accum)
+        
         # Initialize faders based on current block values
         self._initialize_from_blocks()
         
@@ -663,10 +923,10 @@ class GroupWidget(QGraphicsWidget):
         self.block2.hide()
         
         # Initialize mute/solo state from global manager
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
+        manager = self._mute_solo_manager
         self.muted = manager.get_mute_state(self.block1.ctl_name)
         self.soloed = manager.get_solo_state(self.block1.ctl_name)
+        self._sync_flash_connections()
         
         # Connect to mute_solo_manager state_changed signal
         manager.state_changed.connect(self.update_mute_solo_state)
@@ -691,49 +951,44 @@ class GroupWidget(QGraphicsWidget):
     
     def wheelEvent(self, event: Optional[QGraphicsSceneWheelEvent]):
         """Handle mouse wheel for group fader control."""
-        print(f"[DEBUG] GroupWidget.wheelEvent called")
         if not event:
             return
             
-        # Check if mouse is over crossfader or macro fader
-        mouse_pos = event.pos()
-        
-        # Check crossfader area
-        crossfader_rect = QRectF(55, 85, 140, 20)  # Approximate crossfader position
-        if crossfader_rect.contains(mouse_pos):
-            print(f"[DEBUG] Wheel event over crossfader")
-            delta = event.delta()
-            direction = 1 if delta > 0 else -1
-            modifiers = event.modifiers()
-            if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                step_size = 1
-            else:
-                step_size = 5
-            new_value = min(max(self.crossfader.value() + direction * step_size, 0), 100)
-            print(f"[DEBUG] Crossfader: old_value={self.crossfader.value()}, new_value={new_value}")
-            self.crossfader.setValue(new_value)
-            event.accept()
-            return
-            
-        # Check macro fader area
-        macro_rect = QRectF(205, 30, 20, 60)  # Approximate macro fader position
-        if macro_rect.contains(mouse_pos):
-            print(f"[DEBUG] Wheel event over macro fader")
-            delta = event.delta()
-            direction = 1 if delta > 0 else -1
-            modifiers = event.modifiers()
-            if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                step_size = 1
-            else:
-                step_size = 5
-            new_value = min(max(self.macro_fader.value() + direction * step_size, 0), 100)
-            print(f"[DEBUG] Macro fader: old_value={self.macro_fader.value()}, new_value={new_value}")
-            self.macro_fader.setValue(new_value)
-            event.accept()
+        # Let the scene's item index find which fader proxy (if any) is under the cursor
+        scene = self.scene()
+        hit = scene.itemAt(event.scenePos(), QTransform()) if scene else None
+        if hit is self._crossfader_proxy:
+            target = self.crossfader
+        elif hit is self._macro_proxy:
+            target = self.macro_fader
+        else:
+            # If not over any fader, ignore the event
+            event.ignore()
             return
         
-        # If not over any fader, ignore the event
-        event.ignore()
+        delta = event.delta()
+        direction = 1 if delta > 0 else -1
+        modifiers = event.modifiers()
+        if modifiers & Qt.KeyboardModifier.ShiftModifier:
+            step_size = 1
+        else:
+            step_size = 5
+        
+        # Switching faders mid-burst applies the pending steps to the old one first
+        if target is not self._wheel_target:
+            self._apply_wheel_accum()
+            self._wheel_target = target
+        self._wheel_accum += direction * step_size
+        if not self._wheel_timer.isActive():
+            self._wheel_timer.start()
+        event.accept()
+    
+    def _apply_wheel_accum(self):
+        """Apply wheel steps collected during the last burst as a single fader change."""
+        target = self._wheel_target
+        if target is not None and self._wheel_accum:
+            target.setValue(min(max(target.value() + self._wheel_accum, 0), 100))
+        self._wheel_accum = 0
     
     def _setup_geometry(self):
         """Setup the group widget geometry for seamless coverage."""
@@ -741,48 +996,46 @@ class GroupWidget(QGraphicsWidget):
         # Determine which block is on the left
         pos1 = self.block1.scenePos()
         pos2 = self.block2.scenePos()
-        
-        if pos1.x() < pos2.x():
-            left_pos = pos1
-            left_y = pos1.y()
-        else:
-            left_pos = pos2
-            left_y = pos2.y()
+        left_pos = pos1 if pos1.x() < pos2.x() else pos2
         
         # Size to be exactly double a single channel
         width = 240  # Exactly 2 * ChannelBlock.WIDTH
         height = 120  # Same as individual blocks
         
-        # Position to cover both blocks seamlessly (starting from leftmost block)
-        self.setPos(left_pos.x(), left_y)
-        self.setGeometry(QRectF(0, 0, width, height))
+        # Position to cover both blocks seamlessly (starting from leftmost block).
+        # setGeometry() sets the position too, so a separate setPos() would be overwritten
+        self.setGeometry(QRectF(left_pos.x(), left_pos.y(), width, height))
     
     def _create_controls(self):
         """Create the group controls."""
         # Channel names centered at top on two lines - use full ALSA names
-        width = self.geometry().width()
+        geom = self.geometry()
+        width = geom.width()
+        height = geom.height()
         gap = 15
-        height = self.geometry().height()
-        
-        # First channel name - top line (full ALSA name)
-        channel1_name = QGraphicsTextItem(self.block1.ctl_name, self)
-        channel1_name.setDefaultTextColor(QColor("#FFD700"))
-        channel1_name.setFont(QFont("Sans", 7, QFont.Weight.Bold))  # Smaller font for longer names
-        
-        # Center first line
-        name1_rect = channel1_name.boundingRect()
-        name1_x = (width - name1_rect.width()) / 2
-        channel1_name.setPos(name1_x, 8)
-        
-        # Second channel name - second line (full ALSA name)
-        channel2_name = QGraphicsTextItem(self.block2.ctl_name, self)
-        channel2_name.setDefaultTextColor(QColor("#FFD700"))
-        channel2_name.setFont(QFont("Sans", 7, QFont.Weight.Bold))  # Smaller font for longer names
-        
-        # Center second line
-        name2_rect = channel2_name.boundingRect()
-        name2_x = (width - name2_rect.width()) / 2
-        channel2_name.setPos(name2_x, 22)
+        ctl1 = self.block1.ctl_name
+        ctl2 = self.block2.ctl_name
+        
+        # Channel names are plain text items; they have no document margin, so
+        # offset them by _TEXT_MARGIN to keep the original layout. They are static,
+        # so each is rendered once into a device-resolution pixmap
+        name_font = ("Sans", 7, True)  # Smaller font for longer names
+        
+        # First channel name - top line (full ALSA name), centered
+        channel1_name = QGraphicsSimpleTextItem(ctl1, self)
+        channel1_name.setBrush(self._NAME_BRUSH)
+        channel1_name.setFont(_font_for(name_font))
+        name1_x = (width - _text_width(name_font, ctl1)) / 2
+        channel1_name.setPos(name1_x + _TEXT_MARGIN, 8 + _TEXT_MARGIN)
+        channel1_name.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        
+        # Second channel name - second line (full ALSA name), centered
+        channel2_name = QGraphicsSimpleTextItem(ctl2, self)
+        channel2_name.setBrush(self._NAME_BRUSH)
+        channel2_name.setFont(_font_for(name_font))
+        name2_x = (width - _text_width(name_font, ctl2)) / 2
+        channel2_name.setPos(name2_x + _TEXT_MARGIN, 22 + _TEXT_MARGIN)
+        channel2_name.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         
         # Crossfader (horizontal) - match macro fader height for width
         self.crossfader = OvalGrooveSlider(Qt.Orientation.Horizontal, handle_color="#3f7fff", groove_color="#222")
@@ -791,7 +1044,7 @@ class GroupWidget(QGraphicsWidget):
         macro_height = 100
         self.crossfader.setFixedSize(macro_height, 20)
         
-        crossfader_proxy = QGraphicsProxyWidget(self)
+        self._crossfader_proxy = crossfader_proxy = QGraphicsProxyWidget(self)
         crossfader_proxy.setWidget(self.crossfader)
         crossfader_x = (width - macro_height) / 2
         crossfader_y = height - 20 - gap
@@ -803,27 +1056,27 @@ class GroupWidget(QGraphicsWidget):
         self.macro_fader.setValue(100)
         self.macro_fader.setFixedSize(20, macro_height)
         
-        macro_proxy = QGraphicsProxyWidget(self)
+        self._macro_proxy = macro_proxy = QGraphicsProxyWidget(self)
         macro_proxy.setWidget(self.macro_fader)
         macro_x = width - 20 - gap  # Right side with gap
-        group_height = self.geometry().height()
-        macro_y_centered = (group_height - macro_height) // 2
+        macro_y_centered = (height - macro_height) // 2
         macro_proxy.setPos(macro_x, macro_y_centered)
         
         # Volume indicators stacked vertically to the left of macro fader
-        self.vol1_text = QGraphicsTextItem("100", self)
-        self.vol1_text.setDefaultTextColor(QColor("#3f7fff"))
-        self.vol1_text.setFont(QFont("Sans", 7))
-        self.vol2_text = QGraphicsTextItem("100", self)
-        self.vol2_text.setDefaultTextColor(QColor("#ff3f7f"))
-        self.vol2_text.setFont(QFont("Sans", 7))
-        vol1_rect = self.vol1_text.boundingRect()
-        vol2_rect = self.vol2_text.boundingRect()
-        vol_x = macro_x - vol1_rect.width() - 6  # 6px gap to left of macro fader
-        vol1_y = macro_y_centered + (macro_height - (vol1_rect.height() + vol2_rect.height() + 4)) / 2
-        vol2_y = vol1_y + vol1_rect.height() + 4  # 4px gap between values
-        self.vol1_text.setPos(vol_x, vol1_y)
-        self.vol2_text.setPos(vol_x, vol2_y)
+        vol_font = ("Sans", 7, False)
+        self.vol1_text = QGraphicsSimpleTextItem("100", self)
+        self.vol1_text.setBrush(self._VOL1_BRUSH)
+        self.vol1_text.setFont(_font_for(vol_font))
+        self.vol2_text = QGraphicsSimpleTextItem("100", self)
+        self.vol2_text.setBrush(self._VOL2_BRUSH)
+        self.vol2_text.setFont(_font_for(vol_font))
+        vol_width = _text_width(vol_font, "100")
+        vol_height = _text_height(vol_font)
+        vol_x = macro_x - vol_width - 6  # 6px gap to left of macro fader
+        vol1_y = macro_y_centered + (macro_height - (2 * vol_height + 4)) / 2
+        vol2_y = vol1_y + vol_height + 4  # 4px gap between values
+        self.vol1_text.setPos(vol_x + _TEXT_MARGIN, vol1_y + _TEXT_MARGIN)
+        self.vol2_text.setPos(vol_x + _TEXT_MARGIN, vol2_y + _TEXT_MARGIN)
         
         # No labels needed for crossfader and macro fader
         
@@ -854,18 +1107,13 @@ class GroupWidget(QGraphicsWidget):
             crossfader_pos = 50
         
         # Update group faders without triggering signals
-        self.macro_fader.blockSignals(True)
-        self.crossfader.blockSignals(True)
-        
-        self.macro_fader.setValue(macro_level)
-        self.crossfader.setValue(crossfader_pos)
-        
-        self.macro_fader.blockSignals(False)
-        self.crossfader.blockSignals(False)
+        with QSignalBlocker(self.macro_fader), QSignalBlocker(self.crossfader):
+            self.macro_fader.setValue(macro_level)
+            self.crossfader.setValue(crossfader_pos)
         
         # Update volume displays
-        self.vol1_text.setPlainText(str(val1))
-        self.vol2_text.setPlainText(str(val2))
+        self.vol1_text.setText(str(val1))
+        self.vol2_text.setText(str(val2))
     
     def _create_group_buttons(self):
         """Create control buttons for the group based on the channel types."""
@@ -900,47 +1148,24 @@ class GroupWidget(QGraphicsWidget):
         button = QPushButton(text)
         button.setFixedSize(button_size, button_size)
         button.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                background-color: {color};
-                color: white;
-                border: 2px solid #333;
-                border-radius: {button.width()//2}px;
-                font-size: 6px;
-                font-weight: bold;
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {color}aa;
-                border: 2px solid #666;
-            }}
-            QPushButton:pressed {{
-                background-color: {color}77;
-            }}
-        """)
+        # One stylesheet per button; state changes only flip the flashState property
+        button.setStyleSheet(self._button_stylesheet(text, color))
         # Add click handlers for mute and solo buttons
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
         if text == "M":
             button.clicked.connect(self._on_mute_clicked)
-            manager.flash_state_changed.connect(self._update_mute_flash)
         elif text == "S":
             button.clicked.connect(self._on_solo_clicked)
-            manager.flash_state_changed.connect(self._update_solo_flash)
         button_proxy = QGraphicsProxyWidget(self)
         button_proxy.setWidget(button)
         button_proxy.setPos(x, y)
         button_proxy.setAutoFillBackground(False)
-        from PyQt6.QtGui import QPalette
         palette = button_proxy.palette()
         palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.transparent)
         button_proxy.setPalette(palette)
         self.control_buttons.append((button_proxy, button, tooltip))
 
     def _on_mute_clicked(self):
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
+        manager = self._mute_solo_manager
         current_mute = manager.get_mute_state(self.block1.ctl_name)
         new_mute_state = not current_mute
         for block in [self.block1, self.block2]:
@@ -948,8 +1173,7 @@ class GroupWidget(QGraphicsWidget):
         self.update_mute_solo_state()
 
     def _on_solo_clicked(self):
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
+        manager = self._mute_solo_manager
         current_solo = manager.get_solo_state(self.block1.ctl_name)
         new_solo_state = not current_solo
         for block in [self.block1, self.block2]:
@@ -958,52 +1182,59 @@ class GroupWidget(QGraphicsWidget):
 
     def _on_crossfader_changed(self, value: int):
         """Handle crossfader changes."""
-        # Calculate pan ratios (constant-power law)
-        pan = value / 100.0
-        left_ratio = math.cos(pan * math.pi / 2)
-        right_ratio = math.sin(pan * math.pi / 2)
-        
-        # Get macro level
-        macro_level = self.macro_fader.value()
-        
-        # Apply to blocks
-        left_volume = int(macro_level * left_ratio)
-        right_volume = int(macro_level * right_ratio)
-        
-        self.block1.fader_value = left_volume
-        self.block1.update_fader()  # Update ALSA volume
-        self.block2.fader_value = right_volume
-        self.block2.update_fader()  # Update ALSA volume
-        
-        # Update volume displays
-        self.vol1_text.setPlainText(str(left_volume))
-        self.vol2_text.setPlainText(str(right_volume))
+        self._apply_pan(self.macro_fader.value(), value)
     
     def _on_macro_fader_changed(self, value: int):
         """Handle macro fader changes."""
-        # Get crossfader position
-        crossfader_pos = self.crossfader.value()
-        
-        # Calculate pan ratios
-        pan = crossfader_pos / 100.0
-        left_ratio = math.cos(pan * math.pi / 2)
-        right_ratio = math.sin(pan * math.pi / 2)
-        
-        # Apply to blocks
-        left_volume = int(value * left_ratio)
-        right_volume = int(value * right_ratio)
+        self._apply_pan(value, self.crossfader.value())
+    
+    def _apply_pan(self, macro_level: int, crossfader_pos: int):
+        """Split the macro level across both blocks with the constant-power pan law."""
+        left_ratio, right_ratio = _PAN_LUT[crossfader_pos]
+        left_volume = int(macro_level * left_ratio)
+        right_volume = int(macro_level * right_ratio)
         
         self.block1.fader_value = left_volume
-        self.block1.update_fader()  # Update ALSA volume
+        self.block1.update_fader(skip_alsa=True)
         self.block2.fader_value = right_volume
-        self.block2.update_fader()  # Update ALSA volume
+        self.block2.update_fader(skip_alsa=True)
         
         # Update volume displays
-        self.vol1_text.setPlainText(str(left_volume))
-        self.vol2_text.setPlainText(str(right_volume))
+        self.vol1_text.setText(str(left_volume))
+        self.vol2_text.setText(str(right_volume))
+        
+        # Queue the ALSA write; only the latest pair is sent when the timer fires
+        self._pending_volumes = (left_volume, right_volume)
+        if not self._alsa_timer.isActive():
+            self._alsa_timer.start()
+    
+    def _flush_alsa(self):
+        """Write the most recent block volumes to ALSA."""
+        if self._pending_volumes is None:
+            return
+        volumes, self._pending_volumes = self._pending_volumes, None
+        for block, volume in zip((self.block1, self.block2), volumes):
+            try:
+                block.mixer.setvolume(volume)
+            except Exception:
+                pass
     
     def ungroup(self):
         """Ungroup the blocks and restore them."""
+        # Drop any pending wheel steps so they don't land on ungrouped blocks
+        self._wheel_timer.stop()
+        self._wheel_accum = 0
+        # Land the last fader position before the blocks take over
+        self._alsa_timer.stop()
+        self._flush_alsa()
+        
+        # Stop listening to the manager so handlers don't pile up across group churn
+        try:
+            self._mute_solo_manager.state_changed.disconnect(self.update_mute_solo_state)
+        except TypeError:
+            pass  # Already ungrouped
+        self.muted = self.soloed = False
+        self._sync_flash_connections()
         
         # Restore corner rounding for both blocks
         self.block1.left_edge_straight = False
@@ -1043,46 +1274,45 @@ class GroupWidget(QGraphicsWidget):
         painter.setBackgroundMode(Qt.BGMode.OpaqueMode)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Check if either block is a main output
-        is_output_group = self.block1.is_output or self.block2.is_output
-        
         # Draw background
-        painter.setPen(QPen(QColor("#FFD700"), 2))
-        if is_output_group:
-            painter.setBrush(QBrush(QColor("#4a2a2a")))  # Soft red for output groups
-        else:
-            painter.setBrush(QBrush(QColor("#2e3036")))  # Lighter Bitwig-style dark grey for input groups
+        painter.setPen(self._PEN)
+        painter.setBrush(self._bg_brush)
         painter.drawRoundedRect(self.boundingRect(), 12, 12)
 
+    @classmethod
+    def _button_stylesheet(cls, text: str, color: str) -> str:
+        """Build (once per button kind) a stylesheet covering every flashState."""
+        key = (text, color)
+        style = cls._BUTTON_STYLES.get(key)
+        if style is None:
+            rules = [cls._BUTTON_BASE_STYLE, cls._button_color_rules("QPushButton", color)]
+            for state, state_color in cls._BUTTON_STATE_COLORS.get(text, {}).items():
+                rules.append(cls._button_color_rules(f'QPushButton[flashState="{state}"]', state_color))
+            style = cls._BUTTON_STYLES[key] = "\n".join(rules)
+        return style
+    
+    @staticmethod
+    def _button_color_rules(selector: str, color: str) -> str:
+        return (f"{selector} {{ background-color: {color}; }}\n"
+                f"{selector}:hover {{ background-color: {color}aa; border: 2px solid #666; }}\n"
+                f"{selector}:pressed {{ background-color: {color}77; }}")
+    
+    @staticmethod
+    def _set_button_state(button: QPushButton, state: str):
+        """Switch a button between its pre-parsed color rules without re-parsing CSS."""
+        if button.property("flashState") == state:
+            return
+        button.setProperty("flashState", state)
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
+    
     def _update_button_states(self):
         for button_proxy, button, tooltip in self.control_buttons:
             if tooltip in ("Group Mute", "Mute"):
-                is_active = self.muted
-                color = "#ff0000" if is_active else "#888888"
+                self._set_button_state(button, "on" if self.muted else "off")
             elif tooltip in ("Group Solo", "Solo"):
-                is_active = self.soloed
-                color = "#ffe066" if is_active else "#888888"
-            else:
-                continue
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    background-color: {color};
-                    color: white;
-                    border: 2px solid #333;
-                    border-radius: {button.width()//2}px;
-                    font-size: 6px;
-                    font-weight: bold;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{
-                    background-color: {color}aa;
-                    border: 2px solid #666;
-                }}
-                QPushButton:pressed {{
-                    background-color: {color}77;
-                }}
-            """)
+                self._set_button_state(button, "on" if self.soloed else "off")
 
     def _update_mute_flash(self, flash_on: bool):
         if not self.muted:
@@ -1090,52 +1320,13 @@ class GroupWidget(QGraphicsWidget):
             return
         if hasattr(self, 'explicit_mute') and self.explicit_mute:
             # Solid red for explicit mute
-            for button_proxy, button, tooltip in self.control_buttons:
-                if tooltip in ("Group Mute", "Mute"):
-                    color = "#ff0000"
-                    button.setStyleSheet(f"""
-                        QPushButton {{
-                            background: transparent;
-                            background-color: {color};
-                            color: white;
-                            border: 2px solid #333;
-                            border-radius: {button.width()//2}px;
-                            font-size: 6px;
-                            font-weight: bold;
-                            padding: 0px;
-                        }}
-                        QPushButton:hover {{
-                            background-color: {color}aa;
-                            border: 2px solid #666;
-                        }}
-                        QPushButton:pressed {{
-                            background-color: {color}77;
-                        }}
-                    """)
-            return
-        # Flashing for mute-by-solo-logic
+            state = "on"
+        else:
+            # Flashing for mute-by-solo-logic
+            state = "on" if flash_on else "dim"
         for button_proxy, button, tooltip in self.control_buttons:
             if tooltip in ("Group Mute", "Mute"):
-                color = "#ff0000" if flash_on else "#660000"
-                button.setStyleSheet(f"""
-                    QPushButton {{
-                        background: transparent;
-                        background-color: {color};
-                        color: white;
-                        border: 2px solid #333;
-                        border-radius: {button.width()//2}px;
-                        font-size: 6px;
-                        font-weight: bold;
-                        padding: 0px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {color}aa;
-                        border: 2px solid #666;
-                    }}
-                    QPushButton:pressed {{
-                        background-color: {color}77;
-                    }}
-                """)
+                self._set_button_state(button, state)
 
     def _update_solo_flash(self, flash_on: bool):
         if not self.soloed:
@@ -1143,36 +1334,46 @@ class GroupWidget(QGraphicsWidget):
             return
         for button_proxy, button, tooltip in self.control_buttons:
             if tooltip in ("Group Solo", "Solo"):
-                color = "#ffe066" if flash_on else "#7a6a00"
-                button.setStyleSheet(f"""
-                    QPushButton {{
-                        background: transparent;
-                        background-color: {color};
-                        color: white;
-                        border: 2px solid #333;
-                        border-radius: {button.width()//2}px;
-                        font-size: 6px;
-                        font-weight: bold;
-                        padding: 0px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {color}aa;
-                        border: 2px solid #666;
-                    }}
-                    QPushButton:pressed {{
-                        background-color: {color}77;
-                    }}
-                """)
+                self._set_button_state(button, "on" if flash_on else "dim")
 
     def update_mute_solo_state(self):
-        from mute_solo_manager import get_mute_solo_manager
-        manager = get_mute_solo_manager()
+        manager = self._mute_solo_manager
         self.muted = manager.get_mute_state(self.block1.ctl_name)
         self.soloed = manager.get_solo_state(self.block1.ctl_name)
         # Store explicit mute state for correct flashing logic
         self.explicit_mute = False
         if self.block1.ctl_name in manager.channel_states:
             self.explicit_mute = manager.channel_states[self.block1.ctl_name].explicit_mute
+        self._sync_flash_connections()
+        self._schedule_button_refresh()
+
+    def _sync_flash_connections(self):
+        """Subscribe to flash ticks only while a button actually flashes."""
+        manager = self._mute_solo_manager
+        # Explicit mute is drawn solid, only mute-by-solo-logic flashes
+        want_mute = self.muted and not getattr(self, 'explicit_mute', False)
+        if want_mute != self._flash_connected_mute:
+            if want_mute:
+                manager.flash_state_changed.connect(self._update_mute_flash)
+            else:
+                manager.flash_state_changed.disconnect(self._update_mute_flash)
+            self._flash_connected_mute = want_mute
+        want_solo = self.soloed
+        if want_solo != self._flash_connected_solo:
+            if want_solo:
+                manager.flash_state_changed.connect(self._update_solo_flash)
+            else:
+                manager.flash_state_changed.disconnect(self._update_solo_flash)
+            self._flash_connected_solo = want_solo
+
+    def _schedule_button_refresh(self):
+        """Coalesce repeated state updates into one button refresh per event-loop turn."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_button_states)
+
+    def _flush_button_states(self):
+        self._flush_scheduled = False
         self._update_button_states()
 
 
@@ -1183,8 +1384,19 @@ class PatchbayView(QGraphicsView):
         super().__init__()
         self.card = card_index
         self.graphics_scene = QGraphicsScene(0, 0, 2000, 2000)
+        self.graphics_scene.patchbay_view = self
         self.setScene(self.graphics_scene)
-        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Render the scene through OpenGL when available instead of the raster engine
+        if _opengl_available():
+            self.setViewport(QOpenGLWidget())
+        # No view-wide antialiasing; items that draw curves enable it in paint()
+        # Every item sets the pen/brush it uses, so Qt can skip save()/restore() per item
+        self.setOptimizationFlags(QGraphicsView.OptimizationFlag.DontSavePainterState |
+                                  QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing)
+        # Many small items (faders, buttons) repaint together, so redrawing the whole
+        # viewport beats tracking dirty regions; blocks and groups draw from item caches
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
         
         # Snap settings
@@ -1199,6 +1411,12 @@ class PatchbayView(QGraphicsView):
         self._zoom = 1.0
         self._pan_start = QPointF()
         
+        # Single dispatcher for mute/solo updates instead of one connection per block
+        self._mute_solo_manager = manager = get_mute_solo_manager()
+        manager.mute_state_changed.connect(self._on_channel_mute_solo_changed)
+        manager.solo_state_changed.connect(self._on_channel_mute_solo_changed)
+        manager.flash_state_changed.connect(self._on_flash_state_changed)
+        
         self.populate_blocks()
     
     def populate_blocks(self):
@@ -1208,43 +1426,103 @@ class PatchbayView(QGraphicsView):
         # Use all available controls instead of test subset
         available_controls = controls
         
+        # Opening a Mixer and reading its volume is I/O-bound, so probe all controls
+        # concurrently; the Qt items themselves are still built on this (UI) thread
+        def probe(ctl):
+            try:
+                mix = alsa_backend.open_mixer(ctl, self.card)
+                return ctl, mix, mix.getvolume()[0], None
+            except Exception as e:
+                return ctl, None, None, e
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            probed = list(executor.map(probe, available_controls))
+        
         specials = ["Emphasis", "Mask", "PAD", "48V", "Sens.", "Sample Clock", "IEC958"]
         
-        x, y = 50, 50
+        # Grid layout starting at (50, 50), wrapping once x would pass 800
+        step_x = ChannelBlock.WIDTH + 30
+        step_y = ChannelBlock.HEIGHT + 30
+        cols = (800 - 50) // step_x + 1
         blocks_created = 0
         
-        for ctl in available_controls:
-            try:
-                mix = alsaaudio.Mixer(control=ctl, cardindex=self.card)
-                val = mix.getvolume()[0]
-                
-                show_fader = (
-                    val is not None and val != 137578
-                    and not any(kw in ctl for kw in specials)
-                )
-                
-                block = ChannelBlock(ctl, mix, show_fader=show_fader)
-                block.setPos(x, y)
-                
-                self.graphics_scene.addItem(block)
-                self.blocks[ctl] = block  # Store in blocks dictionary
-                blocks_created += 1
-                
-                x += ChannelBlock.WIDTH + 30
-                if x > 800:
-                    x = 50
-                    y += ChannelBlock.HEIGHT + 30
+        # Bulk insert without per-item BSP maintenance; the index is rebuilt once afterwards
+        scene = self.graphics_scene
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        with QSignalBlocker(scene):
+            for ctl, mix, val, error in probed:
+                try:
+                    if error is not None:
+                        raise error
                     
-            except Exception as e:
-                print(f"[ERROR] Failed to create block for {ctl}: {e}")
+                    show_fader = (
+                        val is not None and val != 137578
+                        and not any(kw in ctl for kw in specials)
+                    )
+                    
+                    block = ChannelBlock(ctl, mix, show_fader=show_fader, fader_value=val)
+                    row, col = divmod(blocks_created, cols)
+                    block.setPos(50 + col * step_x, 50 + row * step_y)
+                    
+                    scene.addItem(block)
+                    self.blocks[ctl] = block  # Store in blocks dictionary
+                    blocks_created += 1
+                    
+                except Exception as e:
+                    log.error("Failed to create block for %s: %s", ctl, e)
         
-        print(f"[INFO] Created {blocks_created} channel blocks")
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        
+        log.info("Created %d channel blocks", blocks_created)
         self.update_scene_rect()
+        self._ensure_visible_visuals()
+    
+    def _on_channel_mute_solo_changed(self, ctl_name: str, state: bool):
+        """Refresh only the block whose mute/solo state changed."""
+        block = self.blocks.get(ctl_name)
+        if block:
+            block.update_mute_solo_state()
+    
+    def _on_flash_state_changed(self, flash_on: bool):
+        """Forward flash ticks to blocks that are currently muted or soloed."""
+        manager = self._mute_solo_manager
+        for ctl_name in manager.muted_channels:
+            block = self.blocks.get(ctl_name)
+            if block:
+                block._update_mute_flash(flash_on)
+        for ctl_name in manager.soloed_channels:
+            block = self.blocks.get(ctl_name)
+            if block:
+                block._update_solo_flash(flash_on)
+    
+    def _ensure_visible_visuals(self):
+        """Build the lazy visuals of blocks that are inside the viewport."""
+        scene = self.scene()
+        if scene is None:  # Scene already torn down
+            return
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        for item in scene.items(visible, Qt.ItemSelectionMode.IntersectsItemBoundingRect):
+            if isinstance(item, ChannelBlock) and item.isVisible():
+                item._ensure_visuals()
+    
+    def scrollContentsBy(self, dx: int, dy: int):
+        super().scrollContentsBy(dx, dy)
+        self._ensure_visible_visuals()
     
-    def update_scene_rect(self):
-        """Update scene rectangle to fit all items."""
-        rect = self.graphics_scene.itemsBoundingRect().adjusted(-100, -100, 100, 100)
-        self.graphics_scene.setSceneRect(rect)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._ensure_visible_visuals()
+    
+    def update_scene_rect(self, items=None):
+        """Update scene rectangle to fit all items, or just the given top-level items."""
+        if items is None:
+            rect = self.graphics_scene.itemsBoundingRect()
+        else:
+            # Blocks and groups contain their children, so skip walking every label/button/fader
+            rect = QRectF()
+            for item in items:
+                rect = rect.united(item.sceneBoundingRect())
+        self.graphics_scene.setSceneRect(rect.adjusted(-100, -100, 100, 100))
     
     def mousePressEvent(self, event: Optional[QMouseEvent]):
         """Handle mouse press events."""
@@ -1290,40 +1568,51 @@ class PatchbayView(QGraphicsView):
                 self._zoom *= 1.1
             else:
                 self._zoom /= 1.1
-            self.resetTransform()
-            self.scale(self._zoom, self._zoom)
+            self.setTransform(QTransform.fromScale(self._zoom, self._zoom))
+            self._ensure_visible_visuals()
             event.accept()
         else:
             super().wheelEvent(event)
     
     def check_for_snapping(self, dragged_block: ChannelBlock):
         """Check if the dragged block should snap to another block."""
-        dragged_rect = dragged_block.sceneBoundingRect()
-        for item in self.graphics_scene.items():
+        # Every block has the same fixed size, so edges are plain offsets from pos()
+        width = ChannelBlock.WIDTH
+        height = ChannelBlock.HEIGHT
+        dragged_pos = dragged_block.pos()
+        d_left = dragged_pos.x()
+        d_top = dragged_pos.y()
+        d_right = d_left + width
+        d_bottom = d_top + height
+        # Only blocks touching the dragged one can snap (BSP-indexed spatial query)
+        search_rect = QRectF(d_left - 2, d_top - 2, width + 4, height + 4)
+        for item in self.graphics_scene.items(search_rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect):
             if isinstance(item, ChannelBlock) and item != dragged_block:
                 # Check if this block is already in a group
                 if item.current_group:
                     continue
-                item_rect = item.sceneBoundingRect()
+                item_pos = item.pos()
+                i_left = item_pos.x()
+                i_top = item_pos.y()
+                i_right = i_left + width
+                i_bottom = i_top + height
                 
                 # Check for edge-to-edge contact (at least 1px overlap on edges)
                 # Horizontal edges: left edge of one touches right edge of other
-                left_touches_right = abs(dragged_rect.left() - item_rect.right()) <= 1
-                right_touches_left = abs(dragged_rect.right() - item_rect.left()) <= 1
+                left_touches_right = abs(d_left - i_right) <= 1
+                right_touches_left = abs(d_right - i_left) <= 1
                 
                 # Vertical edges: top edge of one touches bottom edge of other
-                top_touches_bottom = abs(dragged_rect.top() - item_rect.bottom()) <= 1
-                bottom_touches_top = abs(dragged_rect.bottom() - item_rect.top()) <= 1
+                top_touches_bottom = abs(d_top - i_bottom) <= 1
+                bottom_touches_top = abs(d_bottom - i_top) <= 1
                 
                 # Check for actual edge contact (not just area overlap)
                 horizontal_contact = (left_touches_right or right_touches_left) and (
-                    dragged_rect.top() < item_rect.bottom() and 
-                    dragged_rect.bottom() > item_rect.top()
+                    d_top < i_bottom and d_bottom > i_top
                 )
                 
                 vertical_contact = (top_touches_bottom or bottom_touches_top) and (
-                    dragged_rect.left() < item_rect.right() and 
-                    dragged_rect.right() > item_rect.left()
+                    d_left < i_right and d_right > i_left
                 )
                 
                 if horizontal_contact or vertical_contact:
@@ -1354,38 +1643,38 @@ class PatchbayView(QGraphicsView):
     
     def _animate_block_to_position(self, block: ChannelBlock, x: float, y: float):
         """Animate a block to a new position."""
-        animation = QPropertyAnimation(block, b"pos")
+        # Parented to the view so it outlives this call; Qt deletes it when finished
+        animation = QPropertyAnimation(block, b"pos", self)
         animation.setDuration(300)
         animation.setStartValue(block.pos())
         animation.setEndValue(QPointF(x, y))
         animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        animation.start()
+        animation.start(QPropertyAnimation.DeletionPolicy.DeleteWhenStopped)
 
     def serialize_state(self):
         """Serialize the current patchbay state to a dict."""
+        center = self.mapToScene(self.viewport().rect().center())
         state = {
             'blocks': [],
             'groups': [],
             'view_transform': {
                 'zoom': self._zoom,
-                'center': (self.mapToScene(self.viewport().rect().center()).x(),
-                          self.mapToScene(self.viewport().rect().center()).y())
+                'center': (center.x(), center.y())
             }
         }
         
-        # Serialize individual blocks
-        for item in self.graphics_scene.items():
-            if isinstance(item, ChannelBlock):
-                block_state = {
-                    'ctl_name': item.ctl_name,
-                    'position': (item.pos().x(), item.pos().y()),
-                    'fader_value': item.fader_value,
-                    'muted': item.muted,
-                    'soloed': item.soloed,
-                    'channel_type': item.channel_type,
-                    'show_fader': item.show_fader
-                }
-                state['blocks'].append(block_state)
+        # Serialize individual blocks (self.blocks already tracks every ChannelBlock)
+        for item in self.blocks.values():
+            block_state = {
+                'ctl_name': item.ctl_name,
+                'position': (item.pos().x(), item.pos().y()),
+                'fader_value': item.fader_value,
+                'muted': item.muted,
+                'soloed': item.soloed,
+                'channel_type': item.channel_type,
+                'show_fader': item.show_fader
+            }
+            state['blocks'].append(block_state)
         
         # Serialize groups
         for group in self.groups:
@@ -1405,98 +1694,161 @@ class PatchbayView(QGraphicsView):
     def deserialize_state(self, state):
         """Restore the patchbay state from a dict."""
         try:
+            # Send fader writes still queued by blocks and groups that are about to be deleted
+            for block in self.blocks.values():
+                block._flush_alsa()
+            for group in self.groups:
+                group._flush_alsa()
+            
             # Clear existing state
             self.graphics_scene.clear()
             self.groups.clear()
             self.blocks.clear()  # Clear the blocks dictionary
             
-            # Restore view transform
-            if 'view_transform' in state:
-                transform = state['view_transform']
-                self._zoom = transform.get('zoom', 1.0)
-                self.resetTransform()
-                self.scale(self._zoom, self._zoom)
-                
-                center = transform.get('center', (0, 0))
-                self.centerOn(center[0], center[1])
+            # Groups are built from restored blocks, so without blocks there is nothing to add
+            if not state.get('blocks'):
+                self.update_scene_rect()
+                self._restore_view_transform(state)
+                self._ensure_visible_visuals()
+                return True
             
-            # Restore blocks
-            if 'blocks' in state:
-                for block_state in state['blocks']:
-                    ctl_name = block_state['ctl_name']
-                    try:
-                        mixer = alsaaudio.Mixer(control=ctl_name, cardindex=self.card)
-                        block = ChannelBlock(ctl_name, mixer, block_state.get('show_fader', True))
-                        
-                        # Set position
-                        pos = block_state.get('position', (0, 0))
-                        block.setPos(pos[0], pos[1])
-                        
-                        # Set fader value
-                        fader_value = block_state.get('fader_value', 50)
-                        block.fader_value = fader_value
-                        if hasattr(block, 'fader') and block.fader:
-                            block.fader.setValue(fader_value)
-                        
-                        # Set mute/solo state
-                        block.muted = block_state.get('muted', False)
-                        block.soloed = block_state.get('soloed', False)
-                        block.update_mute_solo_state()
-                        
-                        # Add to scene and blocks list
-                        self.graphics_scene.addItem(block)
-                        self.blocks[ctl_name] = block
-                        
-                    except Exception as e:
-                        print(f"[WARNING] Failed to restore block {ctl_name}: {e}")
-            
-            # Restore groups
-            if 'groups' in state:
-                for group_state in state['groups']:
-                    block1_ctl = group_state['block1_ctl']
-                    block2_ctl = group_state['block2_ctl']
+            # Bulk restore without per-item BSP maintenance, scene signals or
+            # viewport repaints; the index is rebuilt once at the end
+            scene = self.graphics_scene
+            self.setUpdatesEnabled(False)
+            scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+            try:
+                with QSignalBlocker(scene):
+                    # Restore blocks
+                    new_blocks = []
+                    if 'blocks' in state:
+                        # Enumerate the card's controls once; saved controls it no longer has are skipped
+                        valid_controls = set(alsa_backend.list_mixer_controls(self.card))
+                        for block_state in state['blocks']:
+                            ctl_name = block_state['ctl_name']
+                            if ctl_name not in valid_controls:
+                                continue
+                            try:
+                                # The saved fader value stands in for the ALSA read, and the
+                                # mixer is only opened on the first write, so restoring does no ALSA I/O
+                                fader_value = block_state.get('fader_value', 50)
+                                block = ChannelBlock(ctl_name, alsa_backend.LazyMixer(ctl_name, self.card),
+                                                     block_state.get('show_fader', True), fader_value)
+                                
+                                # Set position
+                                pos = block_state.get('position', (0, 0))
+                                block.setPos(pos[0], pos[1])
+                                
+                                # Set mute/solo state
+                                block.muted = block_state.get('muted', False)
+                                block.soloed = block_state.get('soloed', False)
+                                block.update_mute_solo_state()
+                                
+                                # Scene insertion is batched below, once groups have hidden their members
+                                new_blocks.append(block)
+                                self.blocks[ctl_name] = block
+                                
+                            except Exception as e:
+                                log.warning("Failed to restore block %s: %s", ctl_name, e)
                     
-                    if block1_ctl in self.blocks and block2_ctl in self.blocks:
-                        block1 = self.blocks[block1_ctl]
-                        block2 = self.blocks[block2_ctl]
-                        
-                        # Create group
-                        group = GroupWidget(block1, block2, self)
-                        
-                        # Set position
-                        pos = group_state.get('position', (0, 0))
-                        group.setPos(pos[0], pos[1])
-                        
-                        # Set fader values
-                        crossfader_value = group_state.get('crossfader_value', 50)
-                        macro_fader_value = group_state.get('macro_fader_value', 50)
-                        group.crossfader.setValue(crossfader_value)
-                        group.macro_fader.setValue(macro_fader_value)
-                        
-                        # Set mute/solo state
-                        group.muted = group_state.get('muted', False)
-                        group.soloed = group_state.get('soloed', False)
-                        group.update_mute_solo_state()
-                        
-                        # Add to scene and groups list
-                        self.graphics_scene.addItem(group)
-                        self.groups.append(group)
+                    # Restore groups
+                    new_groups = []
+                    if 'groups' in state:
+                        for group_state in state['groups']:
+                            block1 = self.blocks.get(group_state['block1_ctl'])
+                            block2 = self.blocks.get(group_state['block2_ctl'])
+                            
+                            if block1 is not None and block2 is not None:
+                                # Create group
+                                group = GroupWidget(block1, block2, self)
+                                
+                                # Set position
+                                pos = group_state.get('position', (0, 0))
+                                group.setPos(pos[0], pos[1])
+                                
+                                # Set fader values
+                                crossfader_value = group_state.get('crossfader_value', 50)
+                                macro_fader_value = group_state.get('macro_fader_value', 50)
+                                initial_values = (group.crossfader.value(), group.macro_fader.value())
+                                with QSignalBlocker(group.crossfader), QSignalBlocker(group.macro_fader):
+                                    group.crossfader.setValue(crossfader_value)
+                                    group.macro_fader.setValue(macro_fader_value)
+                                # Push the restored pan/level to ALSA once instead of once per fader
+                                if (group.crossfader.value(), group.macro_fader.value()) != initial_values:
+                                    group._on_macro_fader_changed(group.macro_fader.value())
+                                
+                                # Set mute/solo state
+                                group.muted = group_state.get('muted', False)
+                                group.soloed = group_state.get('soloed', False)
+                                group.update_mute_solo_state()
+                                
+                                new_groups.append(group)
+                    self.groups.extend(new_groups)
+                    
+                    # Grouped blocks are hidden by now, so their lazy visuals are not built
+                    for item in new_blocks:
+                        scene.addItem(item)
+                    for item in new_groups:
+                        scene.addItem(item)
+            finally:
+                scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+                self.setUpdatesEnabled(True)
+            
+            self.update_scene_rect(new_blocks + new_groups)
             
-            self.update_scene_rect()
+            # Restore view transform in one step, once the scene rect is final
+            self._restore_view_transform(state)
+            self._ensure_visible_visuals()
             return True
             
         except Exception as e:
-            print(f"[ERROR] Failed to deserialize patchbay state: {e}")
+            log.exception("Failed to deserialize patchbay state: %s", e)
             return False
+    
+    def _restore_view_transform(self, state):
+        """Apply the saved zoom and center, if the state has them."""
+        if 'view_transform' not in state:
+            return
+        transform = state['view_transform']
+        zoom = transform.get('zoom', 1.0)
+        center = transform.get('center', (0, 0))
+        self._zoom = zoom
+        # Skip the reset/repaint when the view already shows the saved state
+        current_center = self.mapToScene(self.viewport().rect().center())
+        if (abs(self.transform().m11() - zoom) > 1e-9
+                or abs(current_center.x() - center[0]) > 0.5
+                or abs(current_center.y() - center[1]) > 0.5):
+            self.setTransform(QTransform.fromScale(zoom, zoom))
+            self.centerOn(center[0], center[1])
 
 
 # Custom QSlider with oval groove and circular handle
 class OvalGrooveSlider(QSlider):
+    _DISABLED_BRUSH = QBrush(QColor(0, 0, 0, 80))
+    
     def __init__(self, orientation, handle_color="#3f7fff", groove_color="#222", parent=None):
         super().__init__(orientation, parent)
         self.handle_color = handle_color
         self.groove_color = groove_color
+        self._handle_brush = QBrush(QColor(handle_color))
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        # Groove pixmap cache, keyed by (width, height, groove color, device pixel ratio)
+        self._groove_pixmap = None
+        self._groove_key = None
+        # Geometry is cached per size; the orientation branch is taken once here
+        self._geometry_size = None
+        if orientation == Qt.Orientation.Vertical:
+            self._handle_rect_at = self._vertical_handle_rect
+            self._empty_range_val = 1
+        else:
+            self._handle_rect_at = self._horizontal_handle_rect
+            self._empty_range_val = 0
+    
+    def set_handle_color(self, color):
+        """Change the handle color (the brush is built here, not on every paint)."""
+        self.handle_color = color
+        self._handle_brush = QBrush(QColor(color))
+        self.update()
     
     def wheelEvent(self, event):
         """Override wheelEvent to forward to parent."""
@@ -1504,62 +1856,84 @@ class OvalGrooveSlider(QSlider):
         event.ignore()
         return
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        opt = QStyleOptionSlider()
-        self.initStyleOption(opt)
+    def _groove_pixmap_for(self, groove_rect, radius):
+        """Return the groove rasterized once per size/color instead of on every repaint."""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), self.groove_color, dpr)
+        if self._groove_key != key:
+            pixmap = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            groove_painter = QPainter(pixmap)
+            groove_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            groove_painter.setPen(Qt.PenStyle.NoPen)
+            groove_painter.setBrush(QColor(self.groove_color))
+            groove_painter.drawRoundedRect(groove_rect, radius, radius)
+            groove_painter.end()
+            self._groove_pixmap = pixmap
+            self._groove_key = key
+        return self._groove_pixmap
+
+    def resizeEvent(self, event):
+        # Groove/handle geometry only depends on the widget size, recompute on next paint
+        self._geometry_size = None
+        super().resizeEvent(event)
 
-        # Groove geometry
+    def _update_geometry(self):
+        """Cache the groove rect and handle travel for the current size."""
+        handle_size = 16
         if self.orientation() == Qt.Orientation.Vertical:
             groove_w = 16
             groove_h = self.height() - 12
             groove_x = (self.width() - groove_w) // 2
             groove_y = 6
-            groove_rect = QRectF(groove_x, groove_y, groove_w, groove_h)
-            radius = groove_w / 2
+            self._radius = groove_w / 2
+            self._slider_min = groove_y
+            self._slider_span = groove_h - handle_size
+            self._handle_fixed = (self.width() - handle_size) // 2
         else:
             groove_h = 16
             groove_w = self.width() - 12
             groove_x = 6
             groove_y = (self.height() - groove_h) // 2
-            groove_rect = QRectF(groove_x, groove_y, groove_w, groove_h)
-            radius = groove_h / 2
+            self._radius = groove_h / 2
+            self._slider_min = groove_x
+            self._slider_span = groove_w - handle_size
+            self._handle_fixed = (self.height() - handle_size) // 2
+        self._groove_rect = QRectF(groove_x, groove_y, groove_w, groove_h)
+        self._geometry_size = (self.width(), self.height())
+
+    def _vertical_handle_rect(self, val):
+        return QRectF(self._handle_fixed, self._slider_min + (1 - val) * self._slider_span, 16, 16)
+
+    def _horizontal_handle_rect(self, val):
+        return QRectF(self._slider_min + val * self._slider_span, self._handle_fixed, 16, 16)
+
+    def paintEvent(self, event):
+        if self._geometry_size is None:
+            self._update_geometry()
+        span = self.maximum() - self.minimum()
+        val = (self.value() - self.minimum()) / span if span else self._empty_range_val
+        handle_rect = self._handle_rect_at(val)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw groove (oval)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(self.groove_color))
-        painter.drawRoundedRect(groove_rect, radius, radius)
+        painter.drawPixmap(0, 0, self._groove_pixmap_for(self._groove_rect, self._radius))
 
         # Draw handle (circle)
-        handle_size = 16
-        if self.orientation() == Qt.Orientation.Vertical:
-            slider_min = groove_y
-            slider_max = groove_y + groove_h - handle_size
-            val = (self.maximum() - self.value()) / (self.maximum() - self.minimum()) if self.maximum() != self.minimum() else 0
-            handle_y = slider_min + val * (slider_max - slider_min)
-            handle_x = (self.width() - handle_size) // 2
-            handle_rect = QRectF(handle_x, handle_y, handle_size, handle_size)
-        else:
-            slider_min = groove_x
-            slider_max = groove_x + groove_w - handle_size
-            val = (self.value() - self.minimum()) / (self.maximum() - self.minimum()) if self.maximum() != self.minimum() else 0
-            handle_x = slider_min + val * (slider_max - slider_min)
-            handle_y = (self.height() - handle_size) // 2
-            handle_rect = QRectF(handle_x, handle_y, handle_size, handle_size)
-
-        painter.setBrush(QColor(self.handle_color))
+        painter.setBrush(self._handle_brush)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(handle_rect)
 
         # Draw focus/disabled if needed
         if not self.isEnabled():
-            painter.setBrush(QColor(0, 0, 0, 80))
+            painter.setBrush(self._DISABLED_BRUSH)
             painter.drawEllipse(handle_rect)
 
         painter.end()
 
-
 def main():
     app = QApplication(sys.argv)
     